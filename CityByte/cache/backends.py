@@ -0,0 +1,268 @@
+"""Redis cache with an in-process L1 in front of it.
+
+Reads are served from a byte-bounded LRU of the raw Redis payloads, held for
+a few seconds, so hot keys cost no network hop. Every write or delete goes
+to Redis first and then publishes the affected keys on a pub/sub channel;
+each worker listens on that channel and drops its L1 copies. If the
+subscription drops, the listener clears the whole L1 because it may have
+missed invalidations, and the short TTL bounds staleness either way.
+``clear()`` publishes ``null`` so every worker empties its L1.
+
+Single-flight lock keys always go to Redis: they coordinate workers and a
+cached copy could hide a released lock.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisCache
+
+from CityByte.cache.singleflight import LOCK_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+
+class LocalLRU:
+    """Thread-safe LRU of serialized values bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int, timeout: float):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.size = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, raw = item
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+
+            self._data.move_to_end(key)
+            return raw
+
+    def set(self, key: str, raw: bytes):
+        if len(raw) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._data[key] = (time.monotonic() + self.timeout, raw)
+            self.size += len(raw)
+
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self.size -= len(evicted)
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def _pop(self, key: str):
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= len(item[1])
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class TwoTierCache(RedisCache):
+    """``RedisCache`` that keeps recently read values in process memory.
+
+    Configured through ``OPTIONS["LOCAL"]``: ``max_bytes`` bounds the L1,
+    ``timeout`` is how many seconds a copy may be served without asking
+    Redis, and ``channel`` names the invalidation channel.
+    """
+
+    def __init__(self, server, params):
+        options = dict(params.get("OPTIONS", {}))
+        local = options.pop("LOCAL", {})
+        super().__init__(server, {**params, "OPTIONS": options})
+
+        self._max_bytes = local.get("max_bytes", 32 * 1024 * 1024)
+        self._local_timeout = local.get("timeout", 5)
+        self._channel = local.get("channel", "cache-invalidate")
+
+    @property
+    def _local(self) -> LocalLRU:
+        # Django builds one backend instance per thread, the L1 and its
+        # listener are shared by the whole process.
+        store_key = (tuple(self._servers), self._channel)
+        store = _stores.get(store_key)
+        if store is not None:
+            return store
+
+        with _stores_lock:
+            if store_key not in _stores:
+                _stores[store_key] = LocalLRU(
+                    self._max_bytes, self._local_timeout
+                )
+                threading.Thread(
+                    target=self._listen,
+                    args=(_stores[store_key],),
+                    name="cache-invalidate",
+                    daemon=True,
+                ).start()
+
+        return _stores[store_key]
+
+    def _listen(self, store: LocalLRU):
+        while True:
+            try:
+                pubsub = self._cache.get_client(write=True).pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(self._channel)
+                for message in pubsub.listen():
+                    keys = json.loads(message["data"])
+                    if keys is None:
+                        store.clear()
+                    else:
+                        store.delete(*keys)
+            except Exception:
+                logger.warning("Cache invalidation listener lost Redis")
+
+            store.clear()
+            time.sleep(1)
+
+    def _publish(self, keys):
+        keys = [key for key in keys if self._is_local(key)]
+        if not keys:
+            return
+
+        self._local.delete(*keys)
+        self._cache.get_client(write=True).publish(
+            self._channel, json.dumps(keys)
+        )
+
+    @staticmethod
+    def _is_local(key: str) -> bool:
+        return not key.endswith(LOCK_SUFFIX)
+
+    def _loads(self, raw):
+        return self._cache._serializer.loads(raw)
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        if not self._is_local(key):
+            return self._cache.get(key, default)
+
+        raw = self._local.get(key)
+        if raw is None:
+            raw = self._cache.get_client(key).get(key)
+            if raw is None:
+                return default
+            self._local.set(key, raw)
+
+        return self._loads(raw)
+
+    def get_many(self, keys, version=None):
+        key_map = {
+            self.make_and_validate_key(key, version=version): key
+            for key in keys
+        }
+        found = {}
+        misses = []
+        for key in key_map:
+            raw = self._local.get(key) if self._is_local(key) else None
+            if raw is None:
+                misses.append(key)
+            else:
+                found[key] = raw
+
+        if misses:
+            for key, raw in zip(
+                misses, self._cache.get_client(None).mget(misses)
+            ):
+                if raw is None:
+                    continue
+                found[key] = raw
+                if self._is_local(key):
+                    self._local.set(key, raw)
+
+        return {key_map[k]: self._loads(raw) for k, raw in found.items()}
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = super().add(key, value, timeout, version)
+        if added:
+            self._publish([self.make_and_validate_key(key, version=version)])
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        super().set(key, value, timeout, version)
+        self._publish([self.make_and_validate_key(key, version=version)])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = super().set_many(data, timeout, version)
+        self._publish(
+            [self.make_and_validate_key(key, version=version) for key in data]
+        )
+        return failed
+
+    def set_many_expiring(self, data, version=None):
+        """Like ``set_many``, but ``data`` maps each key to ``(value,
+        timeout)`` and every key keeps its own timeout, still in one
+        pipeline.
+        """
+        data = {
+            self.make_and_validate_key(key, version=version): item
+            for key, item in data.items()
+        }
+        pipeline = self._cache.get_client(None, write=True).pipeline()
+        for key, (value, timeout) in data.items():
+            timeout = self.get_backend_timeout(timeout)
+            if timeout == 0:
+                pipeline.delete(key)
+            else:
+                pipeline.set(
+                    key, self._cache._serializer.dumps(value), ex=timeout
+                )
+        pipeline.execute()
+        self._publish(list(data))
+
+    async def aset_many_expiring(self, data, version=None):
+        return await sync_to_async(self.set_many_expiring)(data, version)
+
+    def delete(self, key, version=None):
+        deleted = super().delete(key, version)
+        self._publish([self.make_and_validate_key(key, version=version)])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        super().delete_many(keys, version)
+        self._publish(
+            [self.make_and_validate_key(key, version=version) for key in keys]
+        )
+
+    def incr(self, key, delta=1, version=None):
+        value = super().incr(key, delta, version)
+        self._publish([self.make_and_validate_key(key, version=version)])
+        return value
+
+    def clear(self):
+        cleared = super().clear()
+        self._local.clear()
+        self._cache.get_client(write=True).publish(
+            self._channel, json.dumps(None)
+        )
+        return cleared
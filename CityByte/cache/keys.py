@@ -0,0 +1,20 @@
+import unicodedata
+
+
+def normalize_city(name: str) -> str:
+    """Case-, accent- and whitespace-insensitive form of a city name, so
+    "São Paulo", "sao paulo" and " SAO  PAULO" all come out the same.
+    """
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(c for c in name if not unicodedata.combining(c))
+
+    return "_".join(name.casefold().split())
+
+
+def city_key(city: str, country: str = None) -> str:
+    """The one cache key prefix for a city, e.g. ``paris:fr``.
+
+    The country code is part of it so Paris, FR and Paris, US never share
+    cached data.
+    """
+    return f"{normalize_city(city)}:{(country or '').strip().casefold()}"
@@ -0,0 +1,15 @@
+import random
+
+from django.conf import settings
+
+
+def timeout_for(kind: str) -> int:
+    """Seconds to cache ``kind`` of data for, per ``CACHE_TTL_POLICY``,
+    randomly spread by the policy's jitter.
+    """
+    policy = settings.CACHE_TTL_POLICY
+    jitter = policy["jitter"]
+
+    return round(
+        policy["timeouts"][kind] * random.uniform(1 - jitter, 1 + jitter)
+    )
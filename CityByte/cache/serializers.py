@@ -0,0 +1,163 @@
+"""msgpack serializer for the Redis cache, compressed above a size threshold.
+
+Every payload starts with a one-byte header naming its compression, so the
+threshold and codec can change without invalidating what is already cached.
+Slotted records and naive datetimes travel as msgpack extension types, aware
+datetimes as msgpack timestamps, which come back in UTC. Record classes
+listed in ``CACHE_SERIALIZER_CONFIG["records"]`` are written as a one-byte
+type code instead of their import path, and a list of them as one extension
+holding every record's state, so a section of a hundred records costs one
+nested (un)pack rather than a hundred. Tuples come back as lists, which
+callers unpack positionally.
+"""
+import zlib
+from datetime import datetime
+
+import msgpack
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+RAW = b"\x00"
+ZLIB = b"\x01"
+LZ4 = b"\x02"
+
+RECORD = 1
+DATETIME = 2
+RECORD_LIST = 3
+# extension codes from here on are the configured record classes
+RECORD_TYPES = 16
+
+
+class MsgpackSerializer:
+    def __init__(self, **overrides):
+        config = {**settings.CACHE_SERIALIZER_CONFIG, **overrides}
+        self.compression = config.get("compression")
+        self.threshold = config.get("threshold", 64 * 1024)
+        self.level = config.get("level", 6)
+
+        if self.compression == "lz4" and lz4 is None:
+            raise ImproperlyConfigured(
+                "lz4 cache compression requires the lz4 package."
+            )
+
+        self._classes = {}
+        self._codes = {}
+        for code, path in enumerate(config.get("records", ()), RECORD_TYPES):
+            cls = import_string(path)
+            self._classes[code] = cls
+            self._codes[cls] = code
+
+    def dumps(self, obj):
+        # Like Django's serializer, leave integers alone so incr() works.
+        if type(obj) is int:
+            return obj
+
+        data = self._pack(self._group(obj))
+        if self.compression is None or len(data) < self.threshold:
+            return RAW + data
+        if self.compression == "lz4":
+            return LZ4 + lz4.frame.compress(data)
+
+        return ZLIB + zlib.compress(data, self.level)
+
+    def loads(self, data):
+        try:
+            return int(data)
+        except ValueError:
+            pass
+
+        header, data = data[:1], data[1:]
+        if header == ZLIB:
+            data = zlib.decompress(data)
+        elif header == LZ4:
+            data = lz4.frame.decompress(data)
+
+        return msgpack.unpackb(
+            data, ext_hook=self._ext_hook, timestamp=3, strict_map_key=False
+        )
+
+    def _pack(self, obj) -> bytes:
+        return msgpack.packb(obj, default=self._default, datetime=True)
+
+    def _unpack(self, data: bytes):
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, timestamp=3)
+
+    def _group(self, obj):
+        """Wrap the lists of ``obj`` holding records of one configured class
+        in ``_Records``, walking containers only.
+        """
+        kind = type(obj)
+        if kind is list or kind is tuple:
+            if obj and type(obj[0]) in self._codes:
+                cls = type(obj[0])
+                if all(type(item) is cls for item in obj):
+                    return _Records(obj)
+
+            return [self._group(item) for item in obj]
+        if kind is dict:
+            return {key: self._group(value) for key, value in obj.items()}
+
+        return obj
+
+    def _default(self, obj):
+        if type(obj) is _Records:
+            records = obj.records
+            return msgpack.ExtType(
+                RECORD_LIST,
+                self._pack(
+                    [
+                        self._codes[type(records[0])],
+                        [record.__getstate__() for record in records],
+                    ]
+                ),
+            )
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(DATETIME, obj.isoformat().encode())
+        if type(obj) in self._codes:
+            return msgpack.ExtType(
+                self._codes[type(obj)], self._pack(obj.__getstate__())
+            )
+        if hasattr(type(obj), "__slots__"):
+            path = f"{type(obj).__module__}.{type(obj).__qualname__}"
+            return msgpack.ExtType(
+                RECORD, self._pack([path, obj.__getstate__()])
+            )
+
+        raise TypeError(f"Cannot cache {type(obj).__name__} values")
+
+    def _ext_hook(self, code, data):
+        if code == RECORD_LIST:
+            code, states = self._unpack(data)
+            return [_record(self._classes[code], state) for state in states]
+        if code == DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == RECORD:
+            path, state = self._unpack(data)
+            if path not in self._classes:
+                self._classes[path] = import_string(path)
+            return _record(self._classes[path], state)
+        if code in self._classes:
+            return _record(self._classes[code], self._unpack(data))
+
+        return msgpack.ExtType(code, data)
+
+
+class _Records:
+    """A list of records of one configured class, packed together."""
+
+    __slots__ = ("records",)
+
+    def __init__(self, records):
+        self.records = records
+
+
+def _record(cls, state):
+    record = cls.__new__(cls)
+    record.__setstate__(state)
+    return record
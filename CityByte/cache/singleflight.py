@@ -0,0 +1,86 @@
+"""Cross-worker single-flight around cache misses.
+
+The first caller to miss a key takes a short-lived lock in the shared cache
+(``cache.add`` is ``SET NX`` on Redis) and fetches the value. Every other
+caller, in this worker or any other, polls the cache until the value shows
+up instead of hitting the provider as well. If the lock holder dies or gives
+up, waiters stop waiting once the lock is gone or ``wait_timeout`` passes.
+"""
+import asyncio
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+LOCK_SUFFIX = "-lock"
+
+
+def _lock_key(key: str) -> str:
+    return f"{key}{LOCK_SUFFIX}"
+
+
+def acquire(key: str):
+    """Return a lock token if this caller should fetch ``key``, else None."""
+    token = uuid4().hex
+
+    if cache.add(
+        _lock_key(key), token, settings.SINGLE_FLIGHT_CONFIG["lock_timeout"]
+    ):
+        return token
+
+    return None
+
+
+def release(key: str, token: str):
+    if cache.get(_lock_key(key)) == token:
+        cache.delete(_lock_key(key))
+
+
+def wait_for_value(key: str):
+    """Poll for the value another caller is fetching, None if it never came."""
+    config = settings.SINGLE_FLIGHT_CONFIG
+    deadline = time.monotonic() + config["wait_timeout"]
+
+    while time.monotonic() < deadline:
+        time.sleep(config["poll_interval"])
+
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(_lock_key(key)) is None:
+            break
+
+    return None
+
+
+async def aacquire(key: str):
+    token = uuid4().hex
+
+    if await cache.aadd(
+        _lock_key(key), token, settings.SINGLE_FLIGHT_CONFIG["lock_timeout"]
+    ):
+        return token
+
+    return None
+
+
+async def arelease(key: str, token: str):
+    if await cache.aget(_lock_key(key)) == token:
+        await cache.adelete(_lock_key(key))
+
+
+async def await_value(key: str):
+    config = settings.SINGLE_FLIGHT_CONFIG
+    deadline = time.monotonic() + config["wait_timeout"]
+
+    while time.monotonic() < deadline:
+        await asyncio.sleep(config["poll_interval"])
+
+        value = await cache.aget(key)
+        if value is not None:
+            return value
+        if await cache.aget(_lock_key(key)) is None:
+            break
+
+    return None
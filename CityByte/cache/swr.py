@@ -0,0 +1,309 @@
+"""Stale-while-revalidate reads for provider data.
+
+Values are stored as ``(value, fresh_until)``. Until ``fresh_until`` the
+value is served as is. After it, the stale value is still served at once
+while a single background refresh replaces it; only once the entry is gone
+altogether (``timeout`` plus ``stale_timeout`` after it was written) does a
+caller block on the provider, through the single-flight lock.
+
+Empty results (``None``, ``{}``, ``[]``, and bundles such as
+``{"dining_info": [], ...}`` whose every value is empty) are cached too, for
+the short ``CACHE_TTL_POLICY`` "empty" timeout, so an unknown or failing
+city does not send every request to every provider. The entry tuple is what
+tells "cached empty" (``(None, fresh_until)``) apart from "missing" (no
+entry at all). A refresh never replaces a cached value with an empty one
+though: providers report most failures as an empty result, and one of them
+must not blank data that is merely stale.
+"""
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from CityByte.cache.policy import timeout_for
+from CityByte.cache.singleflight import (
+    aacquire,
+    acquire,
+    arelease,
+    await_value,
+    release,
+    wait_for_value,
+)
+from info.helpers.fanout import in_background
+
+# Refreshes run on their own threads, or for async fetchers on the background
+# loop, so they outlive the request that noticed the stale entry, whether it
+# was served by WSGI or ASGI.
+_refreshes = ThreadPoolExecutor(
+    max_workers=settings.STALE_WHILE_REVALIDATE_CONFIG["refresh_workers"],
+    thread_name_prefix="cache-refresh",
+)
+
+
+def _timeout_of(timeout, key: str):
+    """``timeout`` may be one timeout for every key or a ``{key: timeout}``
+    mapping.
+    """
+    if isinstance(timeout, dict):
+        return timeout.get(key, DEFAULT_TIMEOUT)
+
+    return timeout
+
+
+def is_empty(value) -> bool:
+    """Whether ``value`` is cached as an empty result: a falsy value, or a
+    bundle whose every value is falsy.
+    """
+    if isinstance(value, dict):
+        return not any(value.values())
+
+    return not value
+
+
+def _entry(value, timeout):
+    if is_empty(value):
+        timeout = timeout_for("empty")
+    elif timeout is DEFAULT_TIMEOUT:
+        timeout = cache.default_timeout
+
+    stale_timeout = settings.STALE_WHILE_REVALIDATE_CONFIG["stale_timeout"]
+
+    return (value, time.time() + timeout), timeout + stale_timeout
+
+
+def _store(key: str, value, timeout):
+    cache.set(key, *_entry(value, timeout))
+
+    return value
+
+
+async def _astore(key: str, value, timeout):
+    await cache.aset(key, *_entry(value, timeout))
+
+    return value
+
+
+def _refresh(key: str, fetch, timeout, token: str):
+    try:
+        value = fetch()
+        if not is_empty(value) or is_empty(_cached_value(key)):
+            _store(key, value, timeout)
+    except Exception:
+        # keep serving the stale value, the next reader will retry
+        pass
+    finally:
+        release(key, token)
+
+
+async def _arefresh(key: str, fetch, timeout, token: str):
+    try:
+        value = await fetch()
+        if not is_empty(value) or is_empty(await _acached_value(key)):
+            await _astore(key, value, timeout)
+    except Exception:
+        # keep serving the stale value, the next reader will retry
+        pass
+    finally:
+        await arelease(key, token)
+
+
+async def _arevalidate(key: str, fetch, timeout):
+    token = await aacquire(key)
+    if token is not None:
+        # on the one long-lived loop, whose keep-alive clients outlive the
+        # request's own loop
+        in_background(_arefresh(key, fetch, timeout, token))
+
+
+def _cached_value(key: str):
+    entry = cache.get(key)
+
+    return None if entry is None else entry[0]
+
+
+async def _acached_value(key: str):
+    entry = await cache.aget(key)
+
+    return None if entry is None else entry[0]
+
+
+def _is_stale(fresh_until) -> bool:
+    return time.time() >= fresh_until
+
+
+def get_or_fetch(key: str, fetch, timeout=DEFAULT_TIMEOUT):
+    entry = cache.get(key)
+
+    if entry is None:
+        token = acquire(key)
+        if token is None:
+            entry = wait_for_value(key)
+
+        if entry is None:
+            try:
+                return _store(key, fetch(), timeout)
+            finally:
+                if token is not None:
+                    release(key, token)
+
+    value, fresh_until = entry
+    if _is_stale(fresh_until):
+        token = acquire(key)
+        if token is not None:
+            _refreshes.submit(_refresh, key, fetch, timeout, token)
+
+    return value
+
+
+async def aget_or_fetch(key: str, fetch, timeout=DEFAULT_TIMEOUT):
+    value, _ = await aget_entry_or_fetch(key, fetch, timeout)
+
+    return value
+
+
+async def aget_entry_or_fetch(
+    key: str, fetch, timeout=DEFAULT_TIMEOUT
+) -> tuple:
+    """Like ``aget_or_fetch``, but return the ``(value, fresh_until)`` entry
+    served, for callers that pass the freshness on.
+    """
+    entry = await cache.aget(key)
+
+    if entry is None:
+        token = await aacquire(key)
+        if token is None:
+            entry = await await_value(key)
+
+        if entry is None:
+            try:
+                entry, ttl = _entry(await fetch(), timeout)
+                await cache.aset(key, entry, ttl)
+                return entry
+            finally:
+                if token is not None:
+                    await arelease(key, token)
+
+    value, fresh_until = entry
+    if _is_stale(fresh_until):
+        await _arevalidate(key, fetch, timeout)
+
+    return value, fresh_until
+
+
+async def _aread_many(fetchers: dict, timeout, refresh: bool) -> tuple:
+    """Read every key of ``fetchers`` in one round trip. Return the values
+    to serve and, with ``refresh``, the stale values that are to be fetched
+    again rather than served.
+    """
+    entries = await cache.aget_many(list(fetchers))
+
+    values, stale = {}, {}
+    for key, (value, fresh_until) in entries.items():
+        if not _is_stale(fresh_until):
+            values[key] = value
+        elif refresh:
+            stale[key] = value
+        else:
+            values[key] = value
+            await _arevalidate(key, fetchers[key], _timeout_of(timeout, key))
+
+    return values, stale
+
+
+async def aget_many(fetchers: dict, timeout=DEFAULT_TIMEOUT) -> dict:
+    """Read every key of ``fetchers`` in one round trip and return the ones
+    that are cached, refreshing stale ones in the background. Keys that are
+    missing are left out; fetch them with ``aget_or_fetch``.
+    """
+    values, _ = await _aread_many(fetchers, timeout, refresh=False)
+
+    return values
+
+
+async def _aset_many(entries: dict):
+    """Write ``{key: (entry, timeout)}`` in one pipeline if the backend can
+    expire every key on its own, otherwise with one ``set_many`` per distinct
+    timeout, sent concurrently.
+    """
+    if not entries:
+        return
+
+    if hasattr(cache, "aset_many_expiring"):
+        await cache.aset_many_expiring(entries)
+        return
+
+    writes = defaultdict(dict)
+    for key, (entry, ttl) in entries.items():
+        writes[ttl][key] = entry
+    await asyncio.gather(
+        *(cache.aset_many(items, ttl) for ttl, items in writes.items())
+    )
+
+
+async def _gather(tasks: dict) -> dict:
+    results = await asyncio.gather(*(task() for task in tasks.values()))
+
+    return dict(zip(tasks, results))
+
+
+async def aget_many_or_fetch(
+    fetchers: dict, timeout=DEFAULT_TIMEOUT, run=_gather, refresh=False
+) -> dict:
+    """Like ``aget_or_fetch`` for many keys at once: one read for all of
+    them, the misses fetched together through ``run`` (a fan-out over a dict
+    of coroutine functions) and written back together by ``_aset_many``.
+
+    With ``refresh``, stale keys are fetched along with the misses instead
+    of in the background, and their fetched values returned, for callers
+    such as cache warming that must know the cache is fresh when they are
+    done. As with a background refresh, an empty value does not replace a
+    stale one in the cache.
+    """
+    values, stale = await _aread_many(fetchers, timeout, refresh)
+    missing = [key for key in fetchers if key not in values]
+    if not missing:
+        return values
+
+    tokens = dict(
+        zip(missing, await asyncio.gather(*(aacquire(k) for k in missing)))
+    )
+
+    waited = {}
+
+    async def fetch(key):
+        # a stale key's entry is there to wait for, but not what is wanted
+        if tokens[key] is None and key not in stale:
+            entry = await await_value(key)
+            if entry is not None:
+                waited[key] = entry[0]
+                return entry[0]
+
+        return await fetchers[key]()
+
+    try:
+        fetched = await run({key: partial(fetch, key) for key in missing})
+
+        await _aset_many(
+            {
+                key: _entry(value, _timeout_of(timeout, key))
+                for key, value in fetched.items()
+                if key not in waited
+                and not (is_empty(value) and not is_empty(stale.get(key)))
+            }
+        )
+    finally:
+        await asyncio.gather(
+            *(
+                arelease(key, token)
+                for key, token in tokens.items()
+                if token is not None
+            )
+        )
+
+    values.update(fetched)
+    return values
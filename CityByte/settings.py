@@ -125,14 +125,153 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Redis behind a per-process L1: hot keys are served from local memory for
+# a few seconds, and writes invalidate other workers over Redis pub/sub.
+# VERSION 2 keys are msgpack, so entries pickled by VERSION 1 are not read.
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "BACKEND": "CityByte.cache.backends.TwoTierCache",
         "LOCATION": "redis://127.0.0.1:6379",
         "TIMEOUT": 3600,
+        "VERSION": 2,
+        "OPTIONS": {
+            "serializer": "CityByte.cache.serializers.MsgpackSerializer",
+            "LOCAL": {
+                "max_bytes": 32 * 1024 * 1024,
+                "timeout": 5,
+                "channel": "cache-invalidate",
+            },
+        },
     }
 }
 
+# Cache payloads at least `threshold` bytes long are compressed with
+# "zlib", or "lz4" if the lz4 package is installed; None disables it. The
+# threshold sits well above a city page section, so cache hits skip it.
+# Records are cached by their position in `records`, so only append to it.
+CACHE_SERIALIZER_CONFIG = {
+    "compression": "zlib",
+    "threshold": 64 * 1024,
+    "level": 6,
+    "records": [
+        "info.records.Place",
+        "info.records.Weather",
+        "info.records.Article",
+    ],
+}
+
+# Cross-worker single-flight on cache misses: how long a fetch may hold the
+# lock, and how long other workers wait for its result before fetching.
+SINGLE_FLIGHT_CONFIG = {
+    "lock_timeout": 10,
+    "wait_timeout": 5,
+    "poll_interval": 0.05,
+}
+
+# How long each kind of cached data stays fresh, in seconds. Every write
+# is spread by up to +/- `jitter` of its timeout so that keys written
+# together are not refreshed together.
+CACHE_TTL_POLICY = {
+    "jitter": 0.1,
+    "timeouts": {
+        "weather": 15 * 60,
+        "news": 60 * 60,
+        "places": 7 * 24 * 60 * 60,
+        "city_photo": 7 * 24 * 60 * 60,
+        "place_photo": 7 * 24 * 60 * 60,
+        "trending": 5 * 60,
+        # empty results and provider failures, retried soon after
+        "empty": 60,
+    },
+}
+
+# Cached provider data stays servable for stale_timeout seconds past its
+# TTL while a background refresh replaces it.
+STALE_WHILE_REVALIDATE_CONFIG = {
+    "stale_timeout": 600,
+    "refresh_workers": 4,
+}
+
+# Place photo links are stable for days: how long clients may cache them,
+# and how many fsq_ids one batch request may resolve.
+PLACE_PHOTO_CONFIG = {
+    "max_age": 86400,
+    "max_batch": 50,
+}
+
+# Upper bound on concurrent upstream calls made while rendering city pages.
+INFO_FANOUT_MAX_WORKERS = 16
+
+# Seconds a city page waits for its sections; the ones still being fetched
+# then are loaded by the page afterwards. None waits for all of them. A
+# skeleton page waits for none and loads every section afterwards.
+INFO_PAGE_CONFIG = {
+    "budget": 0.8,
+    "skeleton": False,
+}
+
+# City page views are buffered per process and written in batches: how often,
+# after how many views at the latest (None: only when flushed explicitly),
+# and how many rows per INSERT. While the database cannot be written, views
+# beyond `max_kept` are dropped, oldest first.
+SEARCH_LOG_CONFIG = {
+    "flush_interval": 5,
+    "max_buffered": 500,
+    "batch_size": 500,
+    "max_kept": 5000,
+}
+
+# `manage.py compact_search_log`: days of raw page views and of hourly and
+# daily rollups to keep, and rows deleted per transaction. Rollups must
+# cover the TRENDING_CONFIG windows.
+SEARCH_LOG_RETENTION_CONFIG = {
+    "raw_days": 90,
+    "hourly_rollup_days": 2,
+    "daily_rollup_days": 30,
+    "batch_size": 1000,
+}
+
+# Trending cities: each window scores the last `buckets` hours or days of
+# page views, halving the weight of a bucket every `half_life` of them.
+TRENDING_CONFIG = {
+    "windows": {
+        "day": {"period": "hour", "buckets": 24, "half_life": 6},
+        "week": {"period": "day", "buckets": 7, "half_life": 2},
+    },
+}
+
+# `manage.py warm_city_cache`: how many of the most viewed cities to warm,
+# how many to load at once, and the upstream calls per second it may spend.
+CACHE_WARM_CONFIG = {
+    "top": 50,
+    "concurrency": 4,
+    "rate": 10,
+}
+
+# Per-provider circuit breakers: trip once `failure_rate` of at least
+# `min_calls` calls in the last `window` seconds failed or took longer than
+# `slow_call` seconds, then fail fast for `open_timeout` seconds, doubling
+# up to `max_open_timeout` while half-open probes keep failing.
+CIRCUIT_BREAKER_CONFIG = {
+    "window": 30,
+    "min_calls": 5,
+    "failure_rate": 0.5,
+    "slow_call": 2.0,
+    "open_timeout": 30,
+    "max_open_timeout": 300,
+}
+
+# Keep-alive connection pools shared by every provider util, one per host,
+# and the connect and read timeouts of every call made through them.
+HTTP_POOL_CONFIG = {
+    "pool_connections": 10,
+    "pool_maxsize": 32,
+    "connect_retries": 2,
+    "backoff_factor": 0.1,
+    "connect_timeout": 2,
+    "read_timeout": 5,
+}
+
 GEODB_CONFIG = {
     "protocol": "https",
     "host": "wft-geo-db.p.rapidapi.com",
@@ -153,6 +292,14 @@ AMADEUS_CONFIG = {
     },
 }
 
+# The Amadeus OAuth token is shared through the cache and renewed
+# refresh_margin seconds before it expires; a rejected token is renewed at
+# most max_attempts - 1 times per request.
+AMADEUS_TOKEN_CONFIG = {
+    "refresh_margin": 60,
+    "max_attempts": 2,
+}
+
 UNSPLASH_CONFIG = {
     "protocol": "https",
     "host": "api.unsplash.com",
@@ -0,0 +1,26 @@
+"""Settings and fixtures shared by the test suites.
+
+The fixtures are imported into each ``conftest.py`` that needs them, as
+``CityByte/pytest.ini`` makes ``CityByte/`` the rootdir when only its tests
+are run, and then the ``conftest.py`` at the top of the tree is not loaded.
+"""
+import pytest
+
+from info.search_log import search_log
+
+# Redis is not assumed to be running under test.
+LOCMEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture(autouse=True)
+def search_log_flushed_by_tests(settings):
+    # The background flusher would write one test's page views into the
+    # database of whichever test runs next.
+    settings.SEARCH_LOG_CONFIG = {
+        **settings.SEARCH_LOG_CONFIG,
+        "flush_interval": None,
+    }
+    yield
+    search_log._buffer.clear()
@@ -10,6 +10,7 @@ import os
 from django.utils import timezone
 #import dotenv
 from info.models import FavCityEntry, CitySearchRecord, Comment
+from info.records import Article
 from django.contrib.messages import get_messages
 #from dotenv import load_dotenv
 from unittest.mock import patch, MagicMock
@@ -140,13 +141,13 @@ class CityNewsViewTests(TestCase):
     def test_city_news_with_articles_one_word_city(self, mock_get_city_news):
         # Mock the response of the get_city_news method for a one-word city
         mock_get_city_news.return_value = [
-            {
+            Article.from_api({
                 "title": "Top Attractions in Paris",
                 "url": "https://news.example.com/paris-attractions",
                 "source": {"name": "Paris News Daily"},
                 "publishedAt": "2024-10-31T08:00:00Z",
                 "description": "Explore the top attractions in Paris, the City of Light."
-            }
+            })
         ]
 
         response = self.client.get(self.url)
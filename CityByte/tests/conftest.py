@@ -0,0 +1 @@
+from CityByte.testing import search_log_flushed_by_tests  # noqa: F401
@@ -0,0 +1,91 @@
+import time
+from unittest.mock import MagicMock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.testing import LOCMEM_CACHE
+from search.utils.search import AmadeusCitySearch
+from search.utils.url import URL
+
+
+UNAUTHORIZED = {"errors": [{"status": 401}]}
+CITIES = {"data": [{"name": "PARIS"}]}
+
+
+def response(data):
+    return MagicMock(json=MagicMock(return_value=data))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AmadeusTokenTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.requests = []
+        self.valid_tokens = set()
+
+    def search(self):
+        util = AmadeusCitySearch(url=URL(**settings.AMADEUS_CONFIG))
+        util._session = MagicMock(request=self.fake_request)
+        return util
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        self.requests.append(method)
+
+        if method == "POST":
+            token = f"token-{len(self.requests)}"
+            self.valid_tokens.add(token)
+            return response({"access_token": token, "expires_in": 1799})
+
+        token = headers["Authorization"].split(" ")[1]
+        if token not in self.valid_tokens:
+            return response(UNAUTHORIZED)
+
+        return response(CITIES)
+
+    def test_token_is_fetched_once_and_shared(self):
+        self.assertEqual(self.search().get_city_suggestions(city="par"), CITIES)
+        self.assertEqual(self.search().get_city_suggestions(city="pa"), CITIES)
+
+        self.assertEqual(self.requests, ["POST", "GET", "GET"])
+
+    def test_token_is_refreshed_ahead_of_expiry(self):
+        self.valid_tokens.add("old")
+        cache.set(AmadeusCitySearch.TOKEN_CACHE_KEY, ("old", time.time() + 5))
+
+        self.search().get_city_suggestions(city="par")
+
+        self.assertEqual(self.requests, ["POST", "GET"])
+        self.assertNotEqual(
+            cache.get(AmadeusCitySearch.TOKEN_CACHE_KEY)[0], "old"
+        )
+
+    def test_rejected_token_is_replaced(self):
+        cache.set(
+            AmadeusCitySearch.TOKEN_CACHE_KEY, ("revoked", time.time() + 900)
+        )
+
+        result = self.search().get_city_suggestions(city="par")
+
+        self.assertEqual(result, CITIES)
+        self.assertEqual(self.requests, ["GET", "POST", "GET"])
+
+    def test_retries_are_capped(self):
+        self.fake_request = MagicMock(
+            side_effect=lambda method, *args, **kwargs: response(
+                {"access_token": "bad", "expires_in": 1799}
+                if method == "POST"
+                else UNAUTHORIZED
+            )
+        )
+
+        result = self.search().get_city_suggestions(city="par")
+
+        self.assertEqual(result, UNAUTHORIZED)
+        get_calls = [
+            c for c in self.fake_request.call_args_list if c.args[0] == "GET"
+        ]
+        self.assertEqual(
+            len(get_calls), settings.AMADEUS_TOKEN_CONFIG["max_attempts"]
+        )
@@ -1,9 +1,11 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from unittest.mock import patch
 from info.models import FavCityEntry, CitySearchRecord, Comment
+from CityByte.testing import LOCMEM_CACHE
 
+@override_settings(CACHES=LOCMEM_CACHE)
 class CityByteAPITests(TestCase):
     def setUp(self):
         self.client = Client()
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from requests.adapters import HTTPAdapter
+
+from CityByte.cache.swr import aget_or_fetch
+from CityByte.testing import LOCMEM_CACHE
+from info.helpers.weather import WeatherBitHelper
+from info.sections import Section, fetch_weather, load_sections
+from search.utils.breaker import CircuitBreaker, CircuitOpenError
+from search.utils.session import get_session
+from search.utils.url import URL
+
+BREAKER = {
+    "window": 30,
+    "min_calls": 4,
+    "failure_rate": 0.5,
+    "slow_call": 2.0,
+    "open_timeout": 30,
+    "max_open_timeout": 300,
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CIRCUIT_BREAKER_CONFIG=BREAKER)
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.breaker = CircuitBreaker("api.example.com")
+
+    def trip(self):
+        for failed in (False, True, False, True):
+            self.breaker.after(self.breaker.before(), failed=failed)
+
+    def expire(self):
+        _, open_timeout = cache.get("breaker:api.example.com")
+        cache.set(
+            "breaker:api.example.com", (time.time() - 1, open_timeout)
+        )
+
+    def test_breaker_opens_at_the_failure_rate(self):
+        for failed in (False, True, False):
+            self.breaker.after(self.breaker.before(), failed=failed)
+        self.assertIsNone(self.breaker.before())
+
+        self.breaker.after(None, failed=True)
+
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before()
+        # every worker shares the open state
+        with self.assertRaises(CircuitOpenError):
+            CircuitBreaker("api.example.com").before()
+
+    def test_one_probe_at_a_time_closes_it(self):
+        self.trip()
+        self.expire()
+
+        probe = self.breaker.before()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before()
+
+        self.breaker.after(probe, failed=False)
+        self.assertIsNone(self.breaker.before())
+
+    def test_failed_probe_backs_off(self):
+        self.trip()
+        self.expire()
+
+        self.breaker.after(self.breaker.before(), failed=True)
+
+        open_until, open_timeout = cache.get("breaker:api.example.com")
+        self.assertEqual(open_timeout, 60)
+        self.assertAlmostEqual(open_until, time.time() + 60, delta=1)
+
+    def test_slow_and_throttled_calls_count_as_failures(self):
+        self.assertTrue(self.breaker.is_failure(200, 2.5))
+        self.assertTrue(self.breaker.is_failure(429, 0.1))
+        self.assertTrue(self.breaker.is_failure(503, 0.1))
+        self.assertFalse(self.breaker.is_failure(404, 0.1))
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CIRCUIT_BREAKER_CONFIG=BREAKER)
+class ProviderFailFastTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch.object(
+        HTTPAdapter, "send", side_effect=requests.exceptions.ConnectTimeout
+    )
+    def test_open_breaker_skips_the_provider(self, send):
+        session = get_session(
+            URL(protocol="https", host="down.example.com", port=443)
+        )
+        for _ in range(4):
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                session.get("https://down.example.com/")
+
+        with self.assertRaises(CircuitOpenError):
+            session.get("https://down.example.com/")
+        self.assertEqual(send.call_count, 4)
+
+    def test_sections_behind_an_open_breaker_render_empty(self):
+        sections = {
+            "weather_info": Section(
+                "weather_info",
+                "{city_key}:weather",
+                AsyncMock(side_effect=CircuitOpenError("weather")),
+            ),
+            "photo_link": Section(
+                "photo_link", "{city_key}:photo", AsyncMock(return_value="x")
+            ),
+        }
+        with patch.dict("info.sections.SECTIONS", sections, clear=True):
+            context = asyncio.run(load_sections("Pune", "IN"))
+
+        self.assertEqual(context, {"weather_info": None, "photo_link": "x"})
+
+    def test_weather_lets_provider_errors_through(self):
+        for error in (
+            CircuitOpenError("weather"),
+            httpx.ConnectTimeout("timed out"),
+        ):
+            with patch.object(
+                WeatherBitHelper,
+                "aget_city_weather",
+                AsyncMock(side_effect=error),
+            ), self.assertRaises(type(error)):
+                asyncio.run(fetch_weather("Pune", "IN"))
+
+    def test_open_breaker_keeps_stale_weather(self):
+        cache.set("pune:in:weather", ({"temp": 1}, time.time() - 1))
+
+        with patch.object(
+            WeatherBitHelper,
+            "aget_city_weather",
+            AsyncMock(side_effect=CircuitOpenError("weather")),
+        ):
+            value = asyncio.run(
+                aget_or_fetch(
+                    "pune:in:weather",
+                    lambda: fetch_weather(city="Pune", country="IN"),
+                )
+            )
+            deadline = time.monotonic() + 2
+            while (
+                cache.get("pune:in:weather-lock")
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+
+        self.assertEqual(value, {"temp": 1})
+        self.assertEqual(cache.get("pune:in:weather")[0], {"temp": 1})
+
+    def test_sections_of_a_failing_provider_render_empty(self):
+        sections = {
+            "weather_info": Section(
+                "weather_info",
+                "{city_key}:weather",
+                AsyncMock(side_effect=httpx.ConnectTimeout("timed out")),
+            ),
+        }
+        with patch.dict("info.sections.SECTIONS", sections, clear=True):
+            context = asyncio.run(load_sections("Pune", "IN"))
+
+        self.assertEqual(context, {"weather_info": None})
@@ -0,0 +1,21 @@
+from django.test import SimpleTestCase
+
+from CityByte.cache.keys import city_key
+
+
+class CityKeyTests(SimpleTestCase):
+    def test_spellings_of_a_city_share_a_key(self):
+        self.assertEqual(
+            {
+                city_key(city, country)
+                for city, country in [
+                    ("São Paulo", "BR"),
+                    ("sao paulo", "br"),
+                    ("  SAO   PAULO ", " BR"),
+                ]
+            },
+            {"sao_paulo:br"},
+        )
+
+    def test_country_tells_cities_apart(self):
+        self.assertNotEqual(city_key("Paris", "FR"), city_key("Paris", "US"))
@@ -0,0 +1,104 @@
+import re
+import time
+from unittest.mock import AsyncMock, patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from CityByte.testing import LOCMEM_CACHE
+from info.records import Place
+from info.sections import Section
+
+POLICY = {"jitter": 0, "timeouts": {"places": 604800, "empty": 60}}
+PLACE = Place(
+    fsq_id="f1", name="Cafe", address="1 Road", category="Cafe", photo_url=""
+)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CACHE_TTL_POLICY=POLICY)
+class CitySectionEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.places = AsyncMock(
+            return_value={"dining_info": [PLACE], "airport_info": []}
+        )
+        self.sections = {
+            "places": Section(
+                "places",
+                "{city_key}:places",
+                self.places,
+                bundle=True,
+                ttl="places",
+            ),
+        }
+
+    def max_age(self, response):
+        return int(re.search(r"max-age=(\d+)", response["Cache-Control"])[1])
+
+    def get(self, name):
+        with patch.dict("info.sections.SECTIONS", self.sections, clear=True):
+            return self.client.get(
+                reverse("info:city_section", args=[name]),
+                {"city": "Pune", "country": "IN"},
+            )
+
+    def test_sections_are_served_as_json(self):
+        response = self.get("dining")
+
+        self.assertEqual(response.json()["data"], [PLACE.as_dict()])
+        self.assertIn("1 Road", response.json()["html"])
+        self.assertAlmostEqual(self.max_age(response), 604800, delta=1)
+        self.assertIn("public", response["Cache-Control"])
+
+    def test_parts_of_one_section_share_its_fetch(self):
+        self.get("dining")
+        response = self.get("airports")
+
+        self.assertEqual(response.json()["data"], [])
+        # empty data is only kept as long as the server keeps it
+        self.assertIn("max-age=60", response["Cache-Control"])
+        self.places.assert_awaited_once()
+
+    def test_max_age_is_what_is_left_of_the_entry_freshness(self):
+        cache.set(
+            "pune:in:places",
+            ({"dining_info": [PLACE]}, time.time() + 100),
+        )
+
+        response = self.get("dining")
+
+        self.assertAlmostEqual(self.max_age(response), 100, delta=1)
+
+    def test_stale_sections_are_not_cacheable(self):
+        cache.set(
+            "pune:in:places", ({"dining_info": [PLACE]}, time.time() - 1)
+        )
+
+        response = self.get("dining")
+
+        self.assertEqual(response.json()["data"], [PLACE.as_dict()])
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertNotIn("public", response["Cache-Control"])
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE, INFO_PAGE_CONFIG={"budget": None, "skeleton": True}
+)
+class SkeletonPageTests(TestCase):
+    def setUp(self):
+        User.objects.create_user(username="skeleton", password="12345")
+        self.client.login(username="skeleton", password="12345")
+
+    @patch("info.views.load_sections", new_callable=AsyncMock)
+    def test_skeleton_loads_every_section_from_the_client(self, load):
+        response = self.client.get(
+            reverse("info_page"), {"city": "Pune", "country": "IN"}
+        )
+
+        load.assert_not_awaited()
+        for name in ["photo", "weather", "dining", "arts", "airports"]:
+            self.assertContains(
+                response, reverse("info:city_section", args=[name])
+            )
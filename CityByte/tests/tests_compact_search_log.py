@@ -0,0 +1,101 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from info import popularity, search_log, trending
+from info.models import CityPopularity, CitySearchRecord, CitySearchRollup
+
+
+def compact(*args):
+    out = StringIO()
+    call_command("compact_search_log", *args, stdout=out)
+    return out.getvalue()
+
+
+class CompactSearchLogTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        views = [
+            ("Pune", "IN", now - timedelta(days=100)),
+            ("pune", "IN", now - timedelta(days=95)),
+            ("Pune", "IN", now - timedelta(days=1)),
+            ("Paris", "FR", now),
+        ]
+        CitySearchRecord.objects.bulk_create(
+            CitySearchRecord(
+                city_name=city, country_name=country, searched_on=on
+            )
+            for city, country, on in views
+        )
+        # recorded before page views had timestamps
+        CitySearchRecord.objects.create(
+            city_name="Lyon", country_name="FR", searched_on=None
+        )
+        trending.add_views(views, popularity.add_views(views))
+        popularity.rebuild()
+
+    def test_old_views_are_archived_and_deleted(self):
+        out = compact("--raw-days", "30", "--batch-size", "2")
+
+        self.assertEqual(
+            sorted(
+                CitySearchRecord.objects.values_list("city_name", flat=True)
+            ),
+            ["Paris", "Pune"],
+        )
+        self.assertEqual(
+            CityPopularity.objects.get(key="pune:in").archived_views, 2
+        )
+        self.assertIn("Compacted 3 page views", out)
+
+    def test_leaderboard_survives_compaction(self):
+        before = list(
+            CityPopularity.objects.values_list("key", "views").order_by("key")
+        )
+
+        compact("--raw-days", "30")
+        popularity.rebuild()
+
+        self.assertEqual(
+            list(
+                CityPopularity.objects.values_list("key", "views").order_by(
+                    "key"
+                )
+            ),
+            before,
+        )
+
+    def test_expired_rollups_are_pruned(self):
+        compact("--hourly-rollup-days", "2", "--daily-rollup-days", "30")
+
+        self.assertEqual(
+            CitySearchRollup.objects.filter(
+                period=CitySearchRollup.HOUR
+            ).count(),
+            2,
+        )
+        self.assertEqual(
+            CitySearchRollup.objects.filter(
+                period=CitySearchRollup.DAY
+            ).count(),
+            2,
+        )
+
+    def test_batches_are_bounded(self):
+        with CaptureQueriesContext(connection) as queries:
+            deleted = search_log.compact(
+                timezone.now() - timedelta(days=30), batch_size=1
+            )
+
+        deletes = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith('DELETE FROM "info_citysearchrecord"')
+        ]
+        self.assertEqual(deleted, 3)
+        self.assertEqual(len(deletes), 3)
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from CityByte.testing import LOCMEM_CACHE
+from info.helpers.fanout import fan_out
+from info.sections import Section
+
+
+def slow(value, delay=0.2):
+    async def task(**kwargs):
+        await asyncio.sleep(delay)
+        return value
+
+    return task
+
+
+def value(result):
+    async def task():
+        return result
+
+    return task
+
+
+class FanOutTests(TestCase):
+    def test_results_keep_their_names(self):
+        results = asyncio.run(fan_out({"a": value(1), "b": value(2)}))
+        self.assertEqual(results, {"a": 1, "b": 2})
+
+    def test_tasks_run_concurrently(self):
+        start = time.monotonic()
+        asyncio.run(fan_out({str(i): slow(i) for i in range(7)}))
+        # seven 200ms tasks should take about as long as one
+        self.assertLess(time.monotonic() - start, 0.6)
+
+    @override_settings(INFO_FANOUT_MAX_WORKERS=2)
+    @patch("info.helpers.fanout._limit", None)
+    def test_calls_are_bounded_across_event_loops(self):
+        running = []
+        peak = []
+
+        async def task():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.pop()
+
+        threads = [
+            threading.Thread(
+                target=asyncio.run,
+                args=(fan_out({str(i): task for i in range(4)}),),
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(peak), 12)
+        self.assertEqual(max(peak), 2)
+
+    def test_task_errors_are_raised(self):
+        async def boom():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(fan_out({"boom": boom}))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class InfoPageFanOutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="fan", password="12345")
+        self.client.login(username="fan", password="12345")
+
+    def test_cold_page_fetches_sections_concurrently(self):
+        sections = {
+            name: Section(name, f"{{city}}-{name}", slow(value, 0.5))
+            for name, value in [
+                ("weather_info", {"temp": 20}),
+                ("news_articles", [{"title": "t"}]),
+                ("dining_info", []),
+                ("airport_info", []),
+                ("outdoor_info", []),
+                ("arts_info", []),
+                ("photo_link", "http://x/p.jpg"),
+            ]
+        }
+        with patch.dict("info.sections.SECTIONS", sections, clear=True):
+            start = time.monotonic()
+            response = self.client.get(
+                reverse("info_page"), {"city": "Pune", "country": "IN"}
+            )
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(response.status_code, 200)
+        # seven 500ms providers, so a serial render would take 3.5s
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(response.context["weather_info"], {"temp": 20})
+        self.assertEqual(cache.get("Pune-photo_link")[0], "http://x/p.jpg")
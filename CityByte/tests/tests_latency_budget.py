@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import patch
+
+import requests
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from requests.adapters import HTTPAdapter
+
+from CityByte.testing import LOCMEM_CACHE
+from info.sections import Section
+from search.utils.session import get_async_client, get_session
+from search.utils.url import URL
+
+
+def counted(value, delay, calls):
+    async def fetch(city, country):
+        calls.append(city)
+        await asyncio.sleep(delay)
+        return value
+
+    return fetch
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    INFO_PAGE_CONFIG={"budget": 0.2, "skeleton": False},
+)
+class LatencyBudgetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username="budget", password="12345")
+        self.client.login(username="budget", password="12345")
+        self.calls = []
+        self.sections = {
+            "weather_info": Section(
+                "weather_info",
+                "{city_key}:weather",
+                counted({"temp": 21}, 1.0, self.calls),
+            ),
+            "photo_link": Section(
+                "photo_link",
+                "{city_key}:photolink",
+                counted("http://x/p.jpg", 0, self.calls),
+            ),
+        }
+
+    def test_slow_sections_are_loaded_after_the_page(self):
+        params = {"city": "Pune", "country": "IN"}
+        with patch.dict("info.sections.SECTIONS", self.sections, clear=True):
+            response = self.client.get(reverse("info_page"), params)
+
+            # rendered without waiting out the slow section
+            self.assertEqual(
+                response.context["pending_parts"], ["weather"]
+            )
+            self.assertEqual(response.context["photo_link"], "http://x/p.jpg")
+            self.assertContains(
+                response, reverse("info:city_section", args=["weather"])
+            )
+
+            # waits for the fetch the page started instead of making another
+            section = self.client.get(
+                reverse("info:city_section", args=["weather"]), params
+            )
+
+        self.assertIn("21 °C", section.json()["html"])
+        self.assertEqual(self.calls, ["Pune", "Pune"])
+
+    def test_unknown_sections_are_not_found(self):
+        response = self.client.get(
+            reverse("info:city_section", args=["secrets"]),
+            {"city": "Pune", "country": "IN"},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    HTTP_POOL_CONFIG={
+        "pool_connections": 1,
+        "pool_maxsize": 1,
+        "connect_retries": 0,
+        "backoff_factor": 0,
+        "connect_timeout": 2,
+        "read_timeout": 5,
+    },
+)
+class ProviderTimeoutTests(SimpleTestCase):
+    @patch.object(HTTPAdapter, "send", return_value=requests.Response())
+    def test_every_call_gets_connect_and_read_timeouts(self, send):
+        send.return_value.status_code = 200
+        session = get_session(
+            URL(protocol="https", host="timeouts.example.com", port=443)
+        )
+
+        session.get("https://timeouts.example.com/")
+        session.get("https://timeouts.example.com/", timeout=1)
+
+        self.assertEqual(send.call_args_list[0].kwargs["timeout"], (2, 5))
+        self.assertEqual(send.call_args_list[1].kwargs["timeout"], 1)
+
+    def test_async_clients_get_connect_and_read_timeouts(self):
+        async def timeout():
+            url = URL(protocol="https", host="timeouts.example.com", port=443)
+            return get_async_client(url).timeout
+
+        timeout = asyncio.run(timeout())
+
+        self.assertEqual((timeout.connect, timeout.read), (2, 5))
@@ -1,7 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from CityByte.testing import LOCMEM_CACHE
 
+@override_settings(CACHES=LOCMEM_CACHE)
 class LoginViewTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='password')
@@ -28,6 +30,7 @@ class LoginViewTests(TestCase):
         self.assertRedirects(response, reverse('main_page'))
 
 
+@override_settings(CACHES=LOCMEM_CACHE)
 class LogoutViewTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='password')
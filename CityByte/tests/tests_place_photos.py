@@ -0,0 +1,122 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from CityByte.testing import LOCMEM_CACHE
+from info.utils.places import FourSquare
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    CACHE_TTL_POLICY={
+        "jitter": 0,
+        "timeouts": {"place_photo": 604800, "empty": 60},
+    },
+)
+class PlacePhotosTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set("photo-link-a", ("https://p/a.jpg", time.time() + 60))
+
+    @patch(
+        "info.utils.places.FourSquare.aget_place_photo",
+        new_callable=AsyncMock,
+        side_effect=lambda fsq_id: f"https://p/{fsq_id}.jpg",
+    )
+    def test_batch_resolves_hits_and_fetches_only_misses(self, photo):
+        response = self.client.get(
+            reverse("info:place_photos"), {"fsq_ids": "a,b,c,b"}
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                "a": "https://p/a.jpg",
+                "b": "https://p/b.jpg",
+                "c": "https://p/c.jpg",
+            },
+        )
+        self.assertEqual(
+            sorted(c.kwargs["fsq_id"] for c in photo.await_args_list),
+            ["b", "c"],
+        )
+        self.assertEqual(cache.get("photo-link-b")[0], "https://p/b.jpg")
+        self.assertIn("max-age=86400", response["Cache-Control"])
+
+    @override_settings(PLACE_PHOTO_CONFIG={"max_age": 60, "max_batch": 2})
+    def test_batch_size_is_capped(self):
+        cache.set("photo-link-b", ("https://p/b.jpg", time.time() + 60))
+        cache.set("photo-link-c", ("https://p/c.jpg", time.time() + 60))
+
+        response = self.client.get(
+            reverse("info:place_photos"), {"fsq_ids": "a,b,c"}
+        )
+
+        self.assertEqual(list(response.json()), ["a", "b"])
+
+    def test_single_photo_redirect_is_cacheable(self):
+        response = self.client.get(
+            reverse("info:place_photo"), {"fsq_id": "a"}
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://p/a.jpg")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=86400", response["Cache-Control"])
+
+    @patch(
+        "info.utils.places.FourSquare.aget_place_photo",
+        new_callable=AsyncMock,
+    )
+    def test_one_failed_lookup_does_not_fail_the_batch(self, photo):
+        def lookup(fsq_id):
+            if fsq_id == "c":
+                raise httpx.ReadTimeout("timed out")
+            return f"https://p/{fsq_id}.jpg"
+
+        photo.side_effect = lookup
+
+        response = self.client.get(
+            reverse("info:place_photos"), {"fsq_ids": "b,c"}
+        )
+
+        self.assertEqual(
+            response.json(),
+            {"b": "https://p/b.jpg", "c": FourSquare.FALLBACK_PHOTO},
+        )
+        self.assertEqual(cache.get("photo-link-b")[0], "https://p/b.jpg")
+        # the fallback is only kept as long as the server keeps it
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+    def test_error_replies_are_not_cached_as_photos(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(429, json={"message": "Quota"})
+            )
+        )
+        with patch("info.utils.places.get_async_client", return_value=client):
+            response = self.client.get(
+                reverse("info:place_photos"), {"fsq_ids": "z"}
+            )
+
+        self.assertEqual(response.json(), {"z": FourSquare.FALLBACK_PHOTO})
+        self.assertIn("max-age=60", response["Cache-Control"])
+        value, fresh_until = cache.get("photo-link-z")
+        self.assertIsNone(value)
+        self.assertAlmostEqual(fresh_until, time.time() + 60, delta=1)
+
+    @patch(
+        "info.helpers.places.FourSquarePlacesHelper.get_place_photo",
+        return_value=None,
+    )
+    def test_single_photo_fallback_is_kept_briefly(self, photo):
+        response = self.client.get(
+            reverse("info:place_photo"), {"fsq_id": "z"}
+        )
+
+        self.assertEqual(response["Location"], FourSquare.FALLBACK_PHOTO)
+        self.assertIn("max-age=60", response["Cache-Control"])
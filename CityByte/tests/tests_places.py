@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase
+
+from info.records import Place
+from info.utils.places import FourSquare
+from search.utils.url import URL
+
+CATEGORIES = ["13065", "19040", "16000", "10000"]
+
+
+def place(name, category_id):
+    return {"name": name, "categories": [{"id": category_id}]}
+
+
+COMBINED = {
+    "results": [place(f"restaurant {i}", 13236) for i in range(6)]
+    + [place(f"park {i}", 16032) for i in range(5)]
+    + [place(f"museum {i}", 10027) for i in range(5)]
+    + [place("bar", 13003)]
+}
+AIRPORTS = {"results": [place("CDG", 19040)]}
+
+
+class MultiCategorySearchTests(SimpleTestCase):
+    def setUp(self):
+        self.foursquare = FourSquare(url=URL(**settings.FOURSQUARE_CONFIG))
+
+    def fake_search(self, city, categories, limit, **kwargs):
+        return COMBINED if "," in categories else AIRPORTS
+
+    def test_one_search_is_split_into_buckets(self):
+        self.foursquare.get_places = MagicMock(side_effect=self.fake_search)
+
+        buckets = self.foursquare.get_places_by_category(
+            "Paris, FR", CATEGORIES, limit=5, sort="RELEVANCE"
+        )
+
+        self.assertEqual(
+            [p["name"] for p in buckets["13065"]["results"]],
+            [f"restaurant {i}" for i in range(5)],
+        )
+        self.assertEqual(len(buckets["16000"]["results"]), 5)
+        self.assertEqual(len(buckets["10000"]["results"]), 5)
+        self.assertEqual(buckets["19040"], AIRPORTS)
+
+    def test_only_short_buckets_are_requeried(self):
+        self.foursquare.get_places = MagicMock(side_effect=self.fake_search)
+
+        self.foursquare.get_places_by_category("Paris, FR", CATEGORIES)
+
+        self.assertEqual(self.foursquare.get_places.call_count, 2)
+        self.assertEqual(
+            self.foursquare.get_places.call_args.kwargs["categories"], "19040"
+        )
+
+    def test_async_split_matches_sync(self):
+        self.foursquare.aget_places = AsyncMock(side_effect=self.fake_search)
+
+        buckets = asyncio.run(
+            self.foursquare.aget_places_by_category("Paris, FR", CATEGORIES)
+        )
+
+        self.assertEqual(self.foursquare.aget_places.await_count, 2)
+        self.assertEqual(buckets["19040"], AIRPORTS)
+        self.assertEqual(len(buckets["13065"]["results"]), 5)
+
+    def test_failed_search_raises_without_requeries(self):
+        requests = []
+
+        def rate_limited(request):
+            requests.append(request)
+            return httpx.Response(429, json={"message": "Quota exceeded"})
+
+        async def search():
+            client = httpx.AsyncClient(
+                transport=httpx.MockTransport(rate_limited)
+            )
+            with patch(
+                "info.utils.places.get_async_client", return_value=client
+            ):
+                await self.foursquare.aget_places_by_category(
+                    "Paris, FR", CATEGORIES
+                )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(search())
+        self.assertEqual(len(requests), 1)
+
+
+class InlinePlacePhotoTests(SimpleTestCase):
+    def test_photo_urls_are_resolved_from_search_fields(self):
+        response = FourSquare._with_photo_urls(
+            {
+                "results": [
+                    {
+                        "name": "Louvre",
+                        "photos": [{"prefix": "https://p/", "suffix": ".jpg"}],
+                    },
+                    {"name": "No photo", "photos": []},
+                    {"name": "Not requested"},
+                ]
+            }
+        )
+        louvre, no_photo, not_requested = response["results"]
+
+        self.assertEqual(louvre["photo_url"], "https://p/250x250.jpg")
+        self.assertNotIn("photos", louvre)
+        self.assertEqual(no_photo["photo_url"], FourSquare.FALLBACK_PHOTO)
+        self.assertNotIn("photo_url", not_requested)
+
+    def test_city_page_links_resolved_photos_directly(self):
+        html = render_to_string(
+            "search/city_info.html",
+            {
+                "city": "Paris",
+                "country": "FR",
+                "dining_info": [
+                    Place(
+                        fsq_id="abc",
+                        name="Bistro",
+                        photo_url="https://p/250x250.jpg",
+                    )
+                ],
+            },
+        )
+
+        self.assertIn('src="https://p/250x250.jpg"', html)
+        self.assertNotIn("place/photo?fsq_id=abc", html)
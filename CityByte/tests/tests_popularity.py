@@ -0,0 +1,74 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from CityByte.testing import LOCMEM_CACHE
+from info import popularity
+from info.models import CityPopularity, CitySearchRecord
+
+
+def views(*cities):
+    return [(city, country, timezone.now()) for city, country in cities]
+
+
+def leaderboard():
+    return [
+        (city.city_name, city.country_name, city.views)
+        for city in popularity.top_cities(10)
+    ]
+
+
+class PopularityTests(TestCase):
+    def test_views_are_counted_per_city(self):
+        popularity.add_views(views(("Pune", "IN"), ("Paris", "FR")))
+        popularity.add_views(views(("pune ", "IN"), ("Pune", "IN")))
+
+        self.assertEqual(
+            leaderboard(), [("Pune", "IN", 3), ("Paris", "FR", 1)]
+        )
+
+    def test_counting_costs_one_update_per_city(self):
+        with CaptureQueriesContext(connection) as queries:
+            popularity.add_views(
+                views(("Pune", "IN"), ("Pune", "IN"), ("Lyon", "FR"))
+            )
+
+        statements = [q["sql"].split()[0] for q in queries]
+        self.assertEqual(statements.count("INSERT"), 1)
+        self.assertEqual(statements.count("UPDATE"), 2)
+
+    def test_backfill_recounts_recorded_views(self):
+        CityPopularity.objects.create(
+            key="stale:xx", city_name="Stale", country_name="XX", views=9
+        )
+        for city, views in [("paris", 1), ("Paris", 2), ("Lyon", 1)]:
+            CitySearchRecord.objects.bulk_create(
+                CitySearchRecord(city_name=city, country_name="FR")
+                for _ in range(views)
+            )
+
+        out = StringIO()
+        call_command("rebuild_city_popularity", stdout=out)
+
+        self.assertEqual(
+            leaderboard(), [("Paris", "FR", 3), ("Lyon", "FR", 1)]
+        )
+        self.assertIn("Counted views of 2 cities", out.getvalue())
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ProfilePopularCitiesTests(TestCase):
+    def test_profile_lists_the_leaderboard(self):
+        User.objects.create_user(username="popular", password="12345")
+        self.client.login(username="popular", password="12345")
+        popularity.add_views(views(("Pune", "IN")))
+
+        response = self.client.get(reverse("profile_page"))
+
+        self.assertContains(response, "Pune, IN")
@@ -0,0 +1,71 @@
+import re
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from info import popularity, search_log, trending
+from info.models import CitySearchRollup, Comment, FavCityEntry
+
+# a plan line scanning a whole table rather than searching an index, as
+# "SCAN t" since SQLite 3.36 and "SCAN TABLE t" before
+FULL_SCAN = re.compile(r"\bSCAN (TABLE )?(\w+)$")
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite's")
+class QueryPlanTests(TestCase):
+    """Every hot query must be answered from an index. A failure here means
+    a model or query change sent one back to scanning its whole table.
+    """
+
+    def assertUsesIndex(self, queryset):
+        plan = queryset.explain()
+        scans = [
+            line for line in plan.splitlines() if FULL_SCAN.search(line)
+        ]
+
+        self.assertEqual(scans, [], f"full table scan in:\n{plan}")
+
+    def test_city_page_comments(self):
+        self.assertUsesIndex(
+            Comment.objects.filter(city="Pune", country="IN").order_by(
+                "-created_on"
+            )
+        )
+
+    def test_city_page_favourite_lookup(self):
+        user = User.objects.create_user(username="plan")
+
+        self.assertUsesIndex(
+            FavCityEntry.objects.filter(city="Pune", country="IN", user=user)
+        )
+        self.assertUsesIndex(FavCityEntry.objects.filter(user=user))
+
+    def test_popular_cities(self):
+        self.assertUsesIndex(popularity.top_cities(10))
+
+    def test_trending_cities(self):
+        for window in ("day", "week"):
+            self.assertUsesIndex(trending.scored(window)[:10])
+
+    def test_popularity_rebuild(self):
+        self.assertUsesIndex(popularity.recorded_views())
+
+    def test_compaction(self):
+        for old in search_log.old_views(timezone.now()):
+            self.assertUsesIndex(old.values_list("id")[:1000])
+
+        self.assertUsesIndex(
+            trending.old_rollups(
+                CitySearchRollup.HOUR, timezone.now()
+            ).values_list("id")[:1000]
+        )
+
+    def test_full_scans_are_caught_in_either_wording(self):
+        for line in ("`--SCAN info_comment", "0|0|0|SCAN TABLE info_comment"):
+            self.assertRegex(line, FULL_SCAN)
+        self.assertNotRegex(
+            "SCAN info_comment USING INDEX info_comment_city_idx", FULL_SCAN
+        )
@@ -0,0 +1,124 @@
+import pickle
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase
+
+from info.helpers.newsapi_helper import NewsAPIHelper
+from info.helpers.places import FourSquarePlacesHelper
+from info.helpers.weather import WeatherBitHelper
+from info.records import Article, Place, Weather
+
+PLACE = {
+    "fsq_id": "abc",
+    "name": "Louvre",
+    "location": {
+        "address": "Rue de Rivoli",
+        "formatted_address": "Rue de Rivoli, 75001 Paris",
+        "locality": "Paris",
+        "postcode": "75001",
+    },
+    "categories": [
+        {
+            "id": 10027,
+            "name": "Art Museum",
+            "icon": {"prefix": "https://ss3.4sqi.net/", "suffix": ".png"},
+        }
+    ],
+    "photo_url": "https://p/250x250.jpg",
+    "geocodes": {"main": {"latitude": 48.86, "longitude": 2.33}},
+}
+ARTICLE = {
+    "source": {"id": None, "name": "Paris Daily"},
+    "author": "A. Writer",
+    "title": "Louvre reopens",
+    "description": "The museum is open again.",
+    "url": "https://news/louvre",
+    "urlToImage": "https://news/louvre.jpg",
+    "publishedAt": "2024-10-31T08:00:00Z",
+    "content": "Long article body " * 200,
+}
+
+
+def util(response):
+    return MagicMock(return_value=MagicMock(**response))
+
+
+class RecordTests(SimpleTestCase):
+    def test_place_keeps_only_rendered_fields(self):
+        place = Place.from_api(PLACE)
+
+        self.assertEqual(
+            place.as_dict(),
+            {
+                "fsq_id": "abc",
+                "name": "Louvre",
+                "address": "Rue de Rivoli, 75001 Paris",
+                "category": "Art Museum",
+                "photo_url": "https://p/250x250.jpg",
+            },
+        )
+        self.assertFalse(hasattr(place, "__dict__"))
+
+    def test_article_is_a_fraction_of_the_payload(self):
+        article = Article.from_api(ARTICLE)
+
+        self.assertEqual(article.source_name, "Paris Daily")
+        self.assertEqual(
+            article.published_at,
+            datetime(2024, 10, 31, 8, tzinfo=timezone.utc),
+        )
+        self.assertLess(
+            len(pickle.dumps(article)), len(pickle.dumps(ARTICLE)) / 10
+        )
+
+    def test_records_survive_pickling(self):
+        place = Place.from_api(PLACE)
+
+        self.assertEqual(pickle.loads(pickle.dumps(place)), place)
+
+    def test_helpers_project_provider_responses(self):
+        places = FourSquarePlacesHelper(
+            klass=util({"get_places.return_value": {"results": [PLACE]}}),
+            url=MagicMock(),
+        ).get_places(city="Paris, FR")
+        weather = WeatherBitHelper(
+            klass=util(
+                {"get_city_weather.return_value": {"data": [{"temp": 20}]}}
+            ),
+            url=MagicMock(),
+        ).get_city_weather(city="Paris")
+
+        self.assertEqual(places, [Place.from_api(PLACE)])
+        self.assertEqual(weather, Weather(temp=20))
+
+    def test_news_helper_projects_articles(self):
+        helper = NewsAPIHelper()
+        helper._session = MagicMock(
+            get=MagicMock(
+                return_value=MagicMock(
+                    status_code=200,
+                    json=MagicMock(return_value={"articles": [ARTICLE]}),
+                )
+            )
+        )
+
+        self.assertEqual(
+            helper.get_city_news("Paris"), [Article.from_api(ARTICLE)]
+        )
+
+    def test_city_page_renders_records(self):
+        html = render_to_string(
+            "search/city_info.html",
+            {
+                "city": "Paris",
+                "country": "FR",
+                "weather_info": Weather(city_name="Paris", temp=21),
+                "arts_info": [Place.from_api(PLACE)],
+            },
+        )
+
+        self.assertIn("21 °C", html)
+        self.assertIn("Rue de Rivoli, 75001 Paris", html)
+        self.assertIn("Art Museum", html)
@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from info.models import CityPopularity, CitySearchRecord
+from info.search_log import SearchLog
+
+SEARCH_LOG = {
+    "flush_interval": None,
+    "max_buffered": 3,
+    "batch_size": 2,
+    "max_kept": 4,
+}
+
+
+@override_settings(SEARCH_LOG_CONFIG=SEARCH_LOG)
+class SearchLogTests(TestCase):
+    def setUp(self):
+        self.log = SearchLog()
+
+    def test_views_are_written_in_one_flush(self):
+        self.log.record("Pune", "IN")
+        self.log.record("Paris", "FR")
+        self.assertEqual(CitySearchRecord.objects.count(), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.log.flush(), 2)
+
+        inserts = [q for q in queries if "citysearchrecord" in q["sql"]]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(
+            sorted(
+                CitySearchRecord.objects.values_list(
+                    "city_name", "country_name"
+                )
+            ),
+            [("Paris", "FR"), ("Pune", "IN")],
+        )
+        self.assertEqual(
+            list(CityPopularity.objects.values_list("key", "views")),
+            [("pune:in", 1), ("paris:fr", 1)],
+        )
+        self.assertEqual(self.log.flush(), 0)
+
+    def test_a_full_buffer_wakes_the_flusher(self):
+        for _ in range(3):
+            self.log.record("Pune", "IN")
+
+        self.assertTrue(self.log._wake.is_set())
+
+    def test_failed_flushes_keep_their_views(self):
+        self.log.record("Pune", "IN")
+
+        with patch.object(
+            CitySearchRecord.objects, "bulk_create", side_effect=OSError
+        ):
+            with self.assertRaises(OSError):
+                self.log.flush()
+
+        self.assertEqual(self.log.flush(), 1)
+
+    def test_views_beyond_max_kept_are_dropped_oldest_first(self):
+        for city in ("Pune", "Paris", "Oslo"):
+            self.log.record(city, "XX")
+
+        with patch.object(
+            CitySearchRecord.objects, "bulk_create", side_effect=OSError
+        ):
+            with self.assertRaises(OSError):
+                self.log.flush()
+
+        self.log.record("Lima", "PE")
+        self.log.record("Rome", "IT")
+
+        self.assertEqual(
+            [city for city, _, _ in self.log._buffer],
+            ["Paris", "Oslo", "Lima", "Rome"],
+        )
+        self.assertEqual(self.log.dropped, 1)
+
+
+class PageViewTests(TestCase):
+    def setUp(self):
+        User.objects.create_user(username="viewer", password="12345")
+        self.client.login(username="viewer", password="12345")
+
+    @patch("info.views.load_sections", new_callable=AsyncMock)
+    @patch("info.views.search_log")
+    def test_page_views_do_not_write_search_records(self, log, load):
+        load.return_value = {}
+
+        self.client.get(
+            reverse("info_page"), {"city": "Pune", "country": "IN"}
+        )
+
+        log.record.assert_called_once_with("Pune", "IN")
+        self.assertEqual(CitySearchRecord.objects.count(), 0)
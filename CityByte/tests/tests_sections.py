@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.testing import LOCMEM_CACHE
+from info.sections import Section, load_sections, refresh_sections
+
+
+def returns(value):
+    async def fetch(city, country):
+        return value
+
+    return fetch
+
+
+SECTIONS = {
+    "weather_info": Section(
+        "weather_info", "{city_key}:weather", returns({"temp": 20})
+    ),
+    "news_articles": Section(
+        "news_articles", "{city_key}:news", returns([{"title": "t"}])
+    ),
+    "places": Section(
+        "places",
+        "{city_key}:places",
+        returns({"dining_info": {"results": []}}),
+        bundle=True,
+    ),
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+@patch.dict("info.sections.SECTIONS", SECTIONS, clear=True)
+class SectionRegistryTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def load(self):
+        spy = MagicMock(wraps=cache, default_timeout=cache.default_timeout)
+        with patch("CityByte.cache.swr.cache", spy):
+            context = asyncio.run(load_sections("Pune", "IN"))
+
+        return context, spy
+
+    def test_bundles_are_spread_into_the_context(self):
+        context, _ = self.load()
+
+        self.assertEqual(
+            context,
+            {
+                "weather_info": {"temp": 20},
+                "news_articles": [{"title": "t"}],
+                "dining_info": {"results": []},
+            },
+        )
+
+    def test_cold_page_reads_once_and_writes_once(self):
+        _, spy = self.load()
+
+        self.assertEqual(spy.aget_many.call_count, 1)
+        self.assertEqual(spy.aset_many.call_count, 1)
+        self.assertEqual(spy.aget.call_count, 0)
+        self.assertEqual(spy.aset.call_count, 0)
+        self.assertEqual(cache.get("pune:in:weather")[0], {"temp": 20})
+
+    def test_warm_page_is_a_single_read(self):
+        self.load()
+        context, spy = self.load()
+
+        self.assertEqual(spy.aget_many.call_count, 1)
+        self.assertEqual(spy.aset_many.call_count, 0)
+        self.assertEqual(context["news_articles"], [{"title": "t"}])
+
+    def test_registering_a_section_adds_no_round_trip(self):
+        sections = {
+            **SECTIONS,
+            "extra": Section("extra", "{city_key}:extra", returns("x")),
+        }
+        with patch.dict("info.sections.SECTIONS", sections):
+            context, spy = self.load()
+
+        self.assertEqual(context["extra"], "x")
+        self.assertEqual(spy.aget_many.call_count, 1)
+        self.assertEqual(spy.aset_many.call_count, 1)
+
+    def test_spellings_of_a_city_share_one_entry(self):
+        self.load()
+        spy = MagicMock(wraps=cache, default_timeout=cache.default_timeout)
+        with patch("CityByte.cache.swr.cache", spy):
+            asyncio.run(load_sections(" PUNE ", "in"))
+            asyncio.run(load_sections("Pune", "US"))
+
+        self.assertEqual(spy.aset_many.call_count, 1)
+        self.assertIsNotNone(cache.get("pune:us:weather"))
+
+    def test_empty_sections_are_not_refetched(self):
+        failing = AsyncMock(return_value={})
+        sections = {
+            "weather_info": Section("weather_info", "{city_key}:w", failing)
+        }
+        with patch.dict("info.sections.SECTIONS", sections, clear=True):
+            self.load()
+            context, _ = self.load()
+
+        self.assertEqual(context["weather_info"], {})
+        self.assertEqual(failing.await_count, 1)
+
+    def test_refresh_fetches_stale_sections_by_name(self):
+        self.load()
+        cache.set("pune:in:news", ([{"title": "old"}], 0))
+
+        values = asyncio.run(refresh_sections("Pune", "IN"))
+
+        self.assertEqual(values["news_articles"], [{"title": "t"}])
+        self.assertEqual(values["weather_info"], {"temp": 20})
+        self.assertEqual(cache.get("pune:in:news")[0], [{"title": "t"}])
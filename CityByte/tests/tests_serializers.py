@@ -0,0 +1,115 @@
+import pickle
+import time
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.cache.serializers import MsgpackSerializer, RAW, ZLIB
+from CityByte.testing import LOCMEM_CACHE
+from info.records import Article, Place, Weather
+
+
+PLACES = {
+    "dining_info": [
+        Place(
+            fsq_id=f"id{i}",
+            name=f"Bistro {i}",
+            address=f"{i} Rue de Rivoli, 75001 Paris",
+            category="French Restaurant",
+            photo_url=f"https://fastly.4sqi.net/img/general/250x250/{i}.jpg",
+        )
+        for i in range(20)
+    ]
+}
+ARTICLES = [
+    Article(
+        title=f"Story {i}",
+        url=f"https://news/{i}",
+        description=f"What happened in Paris today, part {i} of 100.",
+        source_name="Paris Daily",
+        published_at=datetime(2024, 10, 31, 8, tzinfo=timezone.utc),
+    )
+    for i in range(100)
+]
+
+
+class MsgpackSerializerTests(SimpleTestCase):
+    def test_cache_entries_round_trip(self):
+        serializer = MsgpackSerializer()
+        entry = (PLACES, time.time())
+
+        value, fresh_until = serializer.loads(serializer.dumps(entry))
+
+        self.assertEqual(value, PLACES)
+        self.assertEqual(fresh_until, entry[1])
+        self.assertEqual(
+            serializer.loads(serializer.dumps(ARTICLES)), ARTICLES
+        )
+
+    def test_integers_are_left_for_incr(self):
+        serializer = MsgpackSerializer()
+
+        self.assertEqual(serializer.dumps(5), 5)
+        self.assertEqual(serializer.loads(b"5"), 5)
+
+    def test_only_large_payloads_are_compressed(self):
+        serializer = MsgpackSerializer(compression="zlib", threshold=1024)
+
+        small = serializer.dumps(Weather(city_name="Paris", temp=21))
+        large = serializer.dumps(ARTICLES)
+
+        self.assertEqual(small[:1], RAW)
+        self.assertEqual(large[:1], ZLIB)
+        self.assertLess(len(large), len(pickle.dumps(ARTICLES)) / 4)
+
+    def test_sections_are_not_compressed_by_default(self):
+        serializer = MsgpackSerializer()
+
+        self.assertEqual(serializer.dumps((ARTICLES, time.time()))[:1], RAW)
+
+    def test_lists_of_records_are_packed_together(self):
+        serializer = MsgpackSerializer(compression=None)
+        mixed = [ARTICLES[0], PLACES["dining_info"][0], "x"]
+
+        self.assertLess(
+            len(serializer.dumps(ARTICLES)),
+            sum(len(serializer.dumps(article)) for article in ARTICLES),
+        )
+        self.assertEqual(serializer.loads(serializer.dumps(mixed)), mixed)
+
+    def test_compression_setting_can_change_under_cached_data(self):
+        data = MsgpackSerializer(compression="zlib", threshold=0).dumps(
+            ARTICLES
+        )
+
+        self.assertEqual(
+            MsgpackSerializer(compression=None).loads(data), ARTICLES
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SerializerBenchmarkTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_benchmark_reports_every_serializer(self):
+        cache.set("paris:fr:places", (PLACES, time.time()))
+        cache.set("paris:fr:news", (ARTICLES, time.time()))
+        out = StringIO()
+
+        call_command(
+            "bench_cache_serializers",
+            "--city",
+            "Paris",
+            "FR",
+            "--repeat",
+            "2",
+            stdout=out,
+        )
+
+        self.assertIn("2 payloads", out.getvalue())
+        for name in ("pickle", "configured", "msgpack", "msgpack+zlib"):
+            self.assertIn(f"\n{name} ", out.getvalue())
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from info.utils.places import FourSquare
+from search.utils.photo import Unsplash
+from search.utils.search import GeoDB
+from search.utils.session import get_async_client, get_session
+from search.utils.url import URL
+
+
+class SessionPoolTests(SimpleTestCase):
+    def test_session_is_shared_per_host(self):
+        url = URL(**settings.FOURSQUARE_CONFIG)
+
+        self.assertIs(
+            FourSquare(url=url)._session, FourSquare(url=url)._session
+        )
+        self.assertIs(FourSquare(url=url)._session, get_session(url))
+
+    def test_hosts_get_separate_sessions(self):
+        self.assertIsNot(
+            FourSquare(url=URL(**settings.FOURSQUARE_CONFIG))._session,
+            Unsplash(url=URL(**settings.UNSPLASH_CONFIG))._session,
+        )
+
+    def test_adapter_uses_pool_config(self):
+        session = get_session(URL(**settings.UNSPLASH_CONFIG))
+        adapter = session.get_adapter("https://api.unsplash.com/")
+
+        self.assertEqual(
+            adapter._pool_maxsize, settings.HTTP_POOL_CONFIG["pool_maxsize"]
+        )
+        self.assertEqual(
+            adapter.max_retries.connect,
+            settings.HTTP_POOL_CONFIG["connect_retries"],
+        )
+
+    def test_async_client_is_shared_within_a_loop(self):
+        url = URL(**settings.FOURSQUARE_CONFIG)
+
+        async def clients():
+            return get_async_client(url), get_async_client(url)
+
+        first, second = asyncio.run(clients())
+        self.assertIs(first, second)
+        self.assertIsNot(first, asyncio.run(clients())[0])
+
+    def test_async_client_is_closed_with_its_loop(self):
+        url = URL(**settings.FOURSQUARE_CONFIG)
+
+        async def client():
+            return get_async_client(url)
+
+        self.assertTrue(asyncio.run(client()).is_closed)
+
+
+class AsyncCitySuggestionsTests(SimpleTestCase):
+    @patch(
+        "search.utils.search.AmadeusCitySearch.aget_city_suggestions",
+        new_callable=AsyncMock,
+        return_value={"data": [{"name": "PARIS"}]},
+    )
+    def test_city_suggestions_awaits_async_util(self, suggestions):
+        response = self.client.get(reverse("search:city_search"), {"q": "par"})
+
+        self.assertEqual(response.json(), {"results": [{"name": "PARIS"}]})
+        suggestions.assert_awaited_once_with(city="par", max=10)
+
+    def test_city_suggestions_rejects_post(self):
+        response = self.client.post(reverse("search:city_search"))
+
+        self.assertEqual(response.status_code, 405)
+
+    @patch("search.utils.search.get_async_client")
+    def test_geodb_sends_headers_as_headers_only(self, get_async_client):
+        client = get_async_client.return_value
+        client.request = AsyncMock(return_value=MagicMock())
+        url = URL(
+            protocol="https",
+            host="geodb.example.com",
+            port=443,
+            headers={"X-RapidAPI-Key": "secret"},
+        )
+
+        asyncio.run(GeoDB(url=url).aget_city_suggestions("par"))
+
+        kwargs = client.request.await_args.kwargs
+        self.assertEqual(kwargs["headers"], {"X-RapidAPI-Key": "secret"})
+        self.assertEqual(
+            kwargs["params"], {"namePrefix": "par", "offset": 0, "limit": 10}
+        )
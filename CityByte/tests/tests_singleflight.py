@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.cache.swr import aget_or_fetch, get_or_fetch
+from CityByte.testing import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_concurrent_async_misses_fetch_once(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"temp": 20}
+
+        async def stampede():
+            return await asyncio.gather(
+                *(aget_or_fetch("Pune-weather", fetch) for _ in range(10))
+            )
+
+        results = asyncio.run(stampede())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"temp": 20}] * 10)
+        self.assertEqual(cache.get("Pune-weather")[0], {"temp": 20})
+        self.assertIsNone(cache.get("Pune-weather-lock"))
+
+    def test_concurrent_sync_misses_fetch_once(self):
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            threading.Event().wait(0.1)
+            return "http://x/p.jpg"
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    get_or_fetch("photo-link-1", fetch)
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["http://x/p.jpg"] * 5)
+
+    def test_waiters_fetch_themselves_when_leader_fails(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            if len(calls) == 1:
+                raise ConnectionError
+            return ["article"]
+
+        async def stampede():
+            return await asyncio.gather(
+                aget_or_fetch("Nowhere-news", fetch),
+                aget_or_fetch("Nowhere-news", fetch),
+                return_exceptions=True,
+            )
+
+        failed, fetched = asyncio.run(stampede())
+
+        self.assertIsInstance(failed, ConnectionError)
+        self.assertEqual(fetched, ["article"])
+        self.assertEqual(len(calls), 2)
+
+    def test_waiters_share_the_leaders_empty_result(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return None
+
+        async def stampede():
+            return await asyncio.gather(
+                aget_or_fetch("Nowhere-news", fetch),
+                aget_or_fetch("Nowhere-news", fetch),
+            )
+
+        self.assertEqual(asyncio.run(stampede()), [None, None])
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,213 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.cache.swr import (
+    aget_many_or_fetch,
+    aget_or_fetch,
+    get_or_fetch,
+)
+from CityByte.testing import LOCMEM_CACHE
+
+
+def wait_for_refresh(key, timeout=2):
+    deadline = time.monotonic() + timeout
+    while cache.get(f"{key}-lock") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class StaleWhileRevalidateTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fresh_value_is_served_without_fetching(self):
+        cache.set("Pune-news", (["old"], time.time() + 60))
+
+        value = get_or_fetch("Pune-news", lambda: self.fail("fetched"))
+
+        self.assertEqual(value, ["old"])
+
+    def test_entry_outlives_its_ttl_by_the_stale_window(self):
+        with patch.object(cache, "set") as cache_set:
+            get_or_fetch("Pune-news", lambda: ["new"], timeout=60)
+
+        (key, (value, fresh_until), ttl), _ = cache_set.call_args
+        self.assertEqual(value, ["new"])
+        self.assertAlmostEqual(fresh_until, time.time() + 60, delta=1)
+        self.assertEqual(ttl, 60 + 600)
+
+    def test_stale_value_is_served_and_refreshed_in_background(self):
+        cache.set("Pune-news", (["old"], time.time() - 1))
+
+        def fetch():
+            time.sleep(0.1)
+            return ["new"]
+
+        start = time.monotonic()
+        value = get_or_fetch("Pune-news", fetch)
+
+        self.assertEqual(value, ["old"])
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        wait_for_refresh("Pune-news")
+        self.assertEqual(cache.get("Pune-news")[0], ["new"])
+        self.assertIsNone(cache.get("Pune-news-lock"))
+
+    def test_async_stale_value_is_refreshed_once(self):
+        cache.set("Pune-weather", ({"temp": 1}, time.time() - 1))
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"temp": 2}
+
+        async def readers():
+            return await asyncio.gather(
+                *(aget_or_fetch("Pune-weather", fetch) for _ in range(5))
+            )
+
+        self.assertEqual(asyncio.run(readers()), [{"temp": 1}] * 5)
+
+        wait_for_refresh("Pune-weather")
+        self.assertEqual(calls, [1])
+        self.assertEqual(cache.get("Pune-weather")[0], {"temp": 2})
+
+    def test_async_refreshes_share_one_loop(self):
+        loops = []
+
+        async def fetch():
+            loops.append(asyncio.get_running_loop())
+            return {"temp": 2}
+
+        for _ in range(2):
+            cache.set("Pune-weather", ({"temp": 1}, time.time() - 1))
+            asyncio.run(aget_or_fetch("Pune-weather", fetch))
+            wait_for_refresh("Pune-weather")
+
+        self.assertEqual(len(loops), 2)
+        self.assertIs(loops[0], loops[1])
+        self.assertFalse(loops[0].is_closed())
+
+    def test_failed_refresh_keeps_stale_value(self):
+        cache.set("Pune-news", (["old"], time.time() - 1))
+
+        def fetch():
+            raise ConnectionError
+
+        self.assertEqual(get_or_fetch("Pune-news", fetch), ["old"])
+        wait_for_refresh("Pune-news")
+        self.assertEqual(cache.get("Pune-news")[0], ["old"])
+
+    @override_settings(
+        CACHE_TTL_POLICY={"jitter": 0, "timeouts": {"empty": 60}}
+    )
+    def test_empty_results_are_cached_briefly(self):
+        with patch.object(cache, "set", wraps=cache.set) as cache_set:
+            get_or_fetch("Nowhere-news", lambda: [], timeout=3600)
+
+        self.assertEqual(cache_set.call_args.args[2], 60 + 600)
+        self.assertEqual(cache.get("Nowhere-news")[0], [])
+        self.assertEqual(
+            get_or_fetch("Nowhere-news", lambda: self.fail("fetched")), []
+        )
+
+    def test_empty_refresh_keeps_stale_value(self):
+        cache.set("Pune-news", (["old"], time.time() - 1))
+
+        self.assertEqual(get_or_fetch("Pune-news", lambda: []), ["old"])
+        wait_for_refresh("Pune-news")
+        self.assertEqual(cache.get("Pune-news")[0], ["old"])
+
+    def test_async_empty_refresh_keeps_stale_value(self):
+        cache.set("Pune-weather", ({"temp": 1}, time.time() - 1))
+
+        async def fetch():
+            return {}
+
+        self.assertEqual(
+            asyncio.run(aget_or_fetch("Pune-weather", fetch)), {"temp": 1}
+        )
+        wait_for_refresh("Pune-weather")
+        self.assertEqual(cache.get("Pune-weather")[0], {"temp": 1})
+
+    def test_empty_refresh_replaces_cached_empty_value(self):
+        cache.set("Nowhere-news", ([], time.time() - 1))
+
+        get_or_fetch("Nowhere-news", lambda: [])
+        wait_for_refresh("Nowhere-news")
+
+        self.assertGreater(cache.get("Nowhere-news")[1], time.time())
+
+    @override_settings(
+        CACHE_TTL_POLICY={"jitter": 0, "timeouts": {"empty": 60}}
+    )
+    def test_bundles_of_empty_values_are_cached_briefly(self):
+        empty = {"dining_info": [], "airport_info": []}
+
+        get_or_fetch("Nowhere-places", lambda: empty, timeout=604800)
+
+        value, fresh_until = cache.get("Nowhere-places")
+        self.assertEqual(value, empty)
+        self.assertAlmostEqual(fresh_until, time.time() + 60, delta=1)
+
+    def test_empty_bundle_refresh_keeps_stale_bundle(self):
+        places = {"dining_info": ["Cafe"], "airport_info": []}
+        cache.set("Pune-places", (places, time.time() - 1))
+
+        async def fetch():
+            return {"dining_info": [], "airport_info": []}
+
+        self.assertEqual(
+            asyncio.run(aget_or_fetch("Pune-places", fetch)), places
+        )
+        wait_for_refresh("Pune-places")
+        self.assertEqual(cache.get("Pune-places")[0], places)
+
+    def test_refresh_fetches_stale_and_missing_keys_inline(self):
+        cache.set("Pune-news", (["old"], time.time() - 1))
+        cache.set("Pune-weather", ({"temp": 1}, time.time() + 60))
+
+        async def fetch(value):
+            return value
+
+        values = asyncio.run(
+            aget_many_or_fetch(
+                {
+                    "Pune-news": lambda: fetch(["new"]),
+                    "Pune-weather": lambda: self.fail("fetched"),
+                    "Pune-photo": lambda: fetch("photo.jpg"),
+                },
+                timeout=60,
+                refresh=True,
+            )
+        )
+
+        self.assertEqual(
+            values,
+            {
+                "Pune-news": ["new"],
+                "Pune-weather": {"temp": 1},
+                "Pune-photo": "photo.jpg",
+            },
+        )
+        self.assertEqual(cache.get("Pune-news")[0], ["new"])
+        self.assertGreater(cache.get("Pune-news")[1], time.time())
+        self.assertIsNone(cache.get("Pune-news-lock"))
+
+    def test_empty_refresh_is_returned_but_keeps_stale_value(self):
+        cache.set("Pune-news", (["old"], time.time() - 1))
+
+        async def fetch():
+            return []
+
+        values = asyncio.run(
+            aget_many_or_fetch({"Pune-news": fetch}, refresh=True)
+        )
+
+        self.assertEqual(values, {"Pune-news": []})
+        self.assertEqual(cache.get("Pune-news")[0], ["old"])
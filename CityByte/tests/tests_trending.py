@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from CityByte.testing import LOCMEM_CACHE
+from info import popularity, trending
+from info.models import CitySearchRollup
+
+NOW = datetime(2024, 11, 20, 15, 30, tzinfo=dt_timezone.utc)
+
+
+def search(city, country, hours_ago=0, times=1):
+    views = [(city, country, NOW - timedelta(hours=hours_ago))] * times
+    trending.add_views(views, popularity.add_views(views))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+@patch("info.trending.timezone.now", return_value=NOW)
+class TrendingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_views_are_rolled_up_by_hour_and_day(self, now):
+        search("Pune", "IN", hours_ago=0, times=2)
+        search("pune", "IN", hours_ago=1)
+
+        self.assertEqual(
+            sorted(
+                CitySearchRollup.objects.values_list(
+                    "period", "bucket_start", "views"
+                )
+            ),
+            [
+                ("day", NOW.replace(hour=0, minute=0), 3),
+                ("hour", NOW.replace(hour=14, minute=0), 1),
+                ("hour", NOW.replace(minute=0), 2),
+            ],
+        )
+
+    def test_recent_views_outweigh_older_ones(self, now):
+        search("Paris", "FR", hours_ago=20, times=10)
+        search("Pune", "IN", hours_ago=0, times=4)
+
+        today = trending.top_cities("day")
+        week = trending.top_cities("week")
+
+        self.assertEqual(
+            [city["city_name"] for city in today], ["Pune", "Paris"]
+        )
+        # a day old is still recent on the scale of a week
+        self.assertEqual(
+            [city["city_name"] for city in week], ["Paris", "Pune"]
+        )
+
+    def test_views_outside_the_window_do_not_count(self, now):
+        search("Paris", "FR", hours_ago=30)
+
+        self.assertEqual(trending.top_cities("day"), [])
+        self.assertEqual(len(trending.top_cities("week")), 1)
+
+    def test_trending_is_read_from_the_rollups_only(self, now):
+        search("Pune", "IN")
+
+        with self.assertNumQueries(1):
+            trending.top_cities("day")
+        with self.assertNumQueries(0):
+            trending.top_cities("day")
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TrendingPagesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username="trend", password="12345")
+        self.client.login(username="trend", password="12345")
+        views = [("Pune", "IN", datetime.now(dt_timezone.utc))]
+        trending.add_views(views, popularity.add_views(views))
+
+    def test_profile_shows_trending_cities(self):
+        response = self.client.get(reverse("profile_page"))
+
+        self.assertEqual(
+            response.context["trendingToday"][0]["city_name"], "Pune"
+        )
+        self.assertContains(response, "Trending This Week")
+
+    def test_search_page_shows_trending_cities(self):
+        response = self.client.get(reverse("main_page"))
+
+        self.assertContains(response, "Trending now")
+        self.assertContains(response, "Pune, IN")
@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from CityByte.cache.policy import timeout_for
+from CityByte.testing import LOCMEM_CACHE
+from info.sections import Section, load_sections
+
+POLICY = {"jitter": 0, "timeouts": {"weather": 900, "places": 604800}}
+
+
+def returns(value):
+    async def fetch(city, country):
+        return value
+
+    return fetch
+
+
+class TimeoutPolicyTests(SimpleTestCase):
+    @override_settings(
+        CACHE_TTL_POLICY={"jitter": 0.1, "timeouts": {"weather": 1000}}
+    )
+    def test_timeouts_are_jittered_within_bounds(self):
+        timeouts = {timeout_for("weather") for _ in range(200)}
+
+        self.assertTrue(all(900 <= t <= 1100 for t in timeouts))
+        self.assertGreater(len(timeouts), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CACHE_TTL_POLICY=POLICY)
+class SectionTimeoutTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_sections_are_written_with_their_own_timeouts(self):
+        sections = {
+            "weather_info": Section(
+                "weather_info",
+                "{city_key}:weather",
+                returns({"t": 1}),
+                ttl="weather",
+            ),
+            "places": Section(
+                "places",
+                "{city_key}:places",
+                returns({"p": ["x"]}),
+                ttl="places",
+            ),
+            "photo_link": Section(
+                "photo_link", "{city_key}:photo", returns("x"), ttl="places"
+            ),
+        }
+        spy = MagicMock(wraps=cache, default_timeout=cache.default_timeout)
+        with patch.dict("info.sections.SECTIONS", sections, clear=True):
+            with patch("CityByte.cache.swr.cache", spy):
+                asyncio.run(load_sections("Pune", "IN"))
+
+        writes = {
+            c.args[1]: sorted(c.args[0]) for c in spy.aset_many.call_args_list
+        }
+        self.assertEqual(
+            writes,
+            {
+                900 + 600: ["pune:in:weather"],
+                604800 + 600: ["pune:in:photo", "pune:in:places"],
+            },
+        )
+
+    def test_jittered_sections_are_written_in_one_pipeline(self):
+        sections = {
+            name: Section(name, f"{{city_key}}:{name}", returns(name), ttl=ttl)
+            for name, ttl in [
+                ("weather_info", "weather"),
+                ("places", "places"),
+                ("photo_link", "places"),
+            ]
+        }
+        spy = MagicMock(wraps=cache, default_timeout=cache.default_timeout)
+        spy.aset_many_expiring = AsyncMock()
+        policy = {**POLICY, "jitter": 0.1}
+        with override_settings(CACHE_TTL_POLICY=policy):
+            with patch.dict("info.sections.SECTIONS", sections, clear=True):
+                with patch("CityByte.cache.swr.cache", spy):
+                    asyncio.run(load_sections("Pune", "IN"))
+
+        spy.aset_many_expiring.assert_awaited_once()
+        spy.aset_many.assert_not_called()
+        (entries,) = spy.aset_many_expiring.await_args.args
+        self.assertEqual(
+            sorted(entries),
+            ["pune:in:photo_link", "pune:in:places", "pune:in:weather_info"],
+        )
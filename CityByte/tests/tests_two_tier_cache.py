@@ -0,0 +1,175 @@
+import queue
+import time
+from unittest.mock import patch
+
+from django.core.cache.backends.redis import RedisCacheClient
+from django.test import SimpleTestCase
+
+from CityByte.cache.backends import LocalLRU, TwoTierCache
+
+
+class FakeRedis:
+    """Just enough of redis-py for the cache client, with a pub/sub bus."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.reads = 0
+        self.round_trips = 0
+        self.subscribers = []
+
+    def get(self, key):
+        self.reads += 1
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.reads += 1
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value if isinstance(value, bytes) else b"%d" % value
+        self.expiry[key] = ex
+        return True
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            subscriber.put({"data": message})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+
+        return queue
+
+    def execute(self):
+        self.redis.round_trips += 1
+        return [command(*a, **kw) for command, a, kw in self.commands]
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.messages = queue.Queue()
+        redis.subscribers.append(self.messages)
+
+    def subscribe(self, channel):
+        pass
+
+    def listen(self):
+        while True:
+            yield self.messages.get()
+
+
+def worker(redis, name, **local):
+    backend = TwoTierCache(
+        f"redis://{name}", {"OPTIONS": {"LOCAL": {"timeout": 60, **local}}}
+    )
+    client = RedisCacheClient(backend._servers)
+    client.get_client = lambda key=None, write=False: redis
+    backend._cache = client
+    return backend
+
+
+def wait_until(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@patch.dict("CityByte.cache.backends._stores", clear=True)
+class TwoTierCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+
+    def test_warm_reads_skip_redis(self):
+        cache = worker(self.redis, "a")
+        cache.set("Pune-news", ["article"])
+
+        self.assertEqual(cache.get("Pune-news"), ["article"])
+        self.assertEqual(
+            cache.get_many(["Pune-news"]), {"Pune-news": ["article"]}
+        )
+        self.assertEqual(self.redis.reads, 1)
+
+    def test_lock_keys_always_read_redis(self):
+        cache = worker(self.redis, "a")
+        cache.add("Pune-news-lock", "token")
+
+        cache.get("Pune-news-lock")
+        cache.get("Pune-news-lock")
+
+        self.assertEqual(self.redis.reads, 2)
+
+    def test_rewrite_invalidates_other_workers(self):
+        first, second = worker(self.redis, "a"), worker(self.redis, "b")
+        first.set("Pune-weather", {"temp": 20})
+        self.assertEqual(second.get("Pune-weather"), {"temp": 20})
+        wait_until(lambda: len(self.redis.subscribers) == 2)
+
+        first.set("Pune-weather", {"temp": 25})
+
+        wait_until(lambda: second.get("Pune-weather") == {"temp": 25})
+        self.assertEqual(second.get("Pune-weather"), {"temp": 25})
+
+    def test_local_copies_expire(self):
+        cache = worker(self.redis, "a", timeout=0)
+        cache.set("Pune-news", ["article"])
+
+        cache.get("Pune-news")
+        cache.get("Pune-news")
+
+        self.assertEqual(self.redis.reads, 2)
+
+    def test_set_many_expiring_keeps_each_timeout_in_one_round_trip(self):
+        cache = worker(self.redis, "a")
+        cache.get("Pune-news")
+
+        cache.set_many_expiring(
+            {"Pune-news": (["article"], 60), "Pune-weather": ({}, 900)}
+        )
+
+        self.assertEqual(self.redis.round_trips, 1)
+        self.assertEqual(
+            self.redis.expiry,
+            {
+                cache.make_key("Pune-news"): 60,
+                cache.make_key("Pune-weather"): 900,
+            },
+        )
+        self.assertEqual(cache.get("Pune-news"), ["article"])
+
+
+class LocalLRUTests(SimpleTestCase):
+    def test_least_recently_used_is_evicted_by_size(self):
+        lru = LocalLRU(max_bytes=10, timeout=60)
+        lru.set("a", b"1234")
+        lru.set("b", b"1234")
+        lru.get("a")
+
+        lru.set("c", b"1234")
+
+        self.assertEqual(lru.get("a"), b"1234")
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.size, 8)
+
+    def test_oversized_values_are_not_held(self):
+        lru = LocalLRU(max_bytes=4, timeout=60)
+        lru.set("a", b"12345")
+
+        self.assertEqual(len(lru), 0)
@@ -0,0 +1,78 @@
+import time
+from io import StringIO
+from unittest.mock import AsyncMock, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from info import popularity
+from info.models import CitySearchRecord
+
+SECTIONS = {
+    "weather_info": {"temp": 20},
+    "places": {"dining_info": ["Cafe"]},
+}
+
+def warm(*args):
+    out = StringIO()
+    call_command("warm_city_cache", *args, stdout=out, stderr=StringIO())
+    return out.getvalue()
+
+
+@patch(
+    "info.management.commands.warm_city_cache.refresh_sections",
+    new_callable=AsyncMock,
+    return_value=SECTIONS,
+)
+class WarmCityCacheTests(TestCase):
+    def setUp(self):
+        for city, country, views in [
+            ("Paris", "FR", 3),
+            ("paris ", "FR", 1),
+            ("Pune", "IN", 3),
+            ("Paris", "US", 1),
+        ]:
+            CitySearchRecord.objects.bulk_create(
+                CitySearchRecord(city_name=city, country_name=country)
+                for _ in range(views)
+            )
+        popularity.rebuild()
+
+    def test_most_viewed_cities_are_warmed(self, refresh_sections):
+        out = warm("--top", "2", "--rate", "1000")
+
+        self.assertEqual(
+            [c.args for c in refresh_sections.await_args_list],
+            [("Paris", "FR"), ("Pune", "IN")],
+        )
+        self.assertIn("Warmed 2/2 cities", out)
+
+    def test_explicit_cities_skip_the_ranking(self, refresh_sections):
+        warm("--city", "Lyon", "FR", "--rate", "1000")
+
+        refresh_sections.assert_awaited_once_with("Lyon", "FR")
+
+    def test_upstream_calls_are_paced(self, refresh_sections):
+        start = time.monotonic()
+        # up to eight calls per city (places may re-query four categories)
+        # at 40 calls/s is one city every 200ms
+        warm("--top", "3", "--rate", "40")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+    def test_failures_are_reported(self, refresh_sections):
+        refresh_sections.side_effect = ConnectionError
+
+        with self.assertRaises(CommandError):
+            warm("--city", "Lyon", "FR")
+
+    def test_cities_left_empty_are_not_counted(self, refresh_sections):
+        # providers that fail come back as empty sections
+        refresh_sections.return_value = {
+            "weather_info": None,
+            "places": {"dining_info": []},
+        }
+
+        with self.assertRaises(CommandError):
+            warm("--city", "Lyon", "FR")
@@ -23,6 +23,7 @@ import os
 import markdown
 from django.shortcuts import render
 from info.helpers.newsapi_helper import NewsAPIHelper
+from search.utils.breaker import CircuitOpenError
 
 
 class SignUpView(generic.CreateView):
@@ -80,7 +81,10 @@ def city_info(request, city_name):
     
 def city_news(request, city, country):
     news_api_helper = NewsAPIHelper()
-    news_articles = news_api_helper.get_city_news(city)
+    try:
+        news_articles = news_api_helper.get_city_news(city)
+    except CircuitOpenError:
+        news_articles = []
 
     context = {
         "city": city,
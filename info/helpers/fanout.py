@@ -0,0 +1,70 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+
+from django.conf import settings
+
+# One bound for the whole process: every fan-out runs on the background loop,
+# so a burst of cold city pages cannot open an unbounded number of upstream
+# calls, however many event loops the requests were served on.
+_limit = None
+
+
+async def _fan_out(tasks: dict, fallback_on: tuple) -> dict:
+    global _limit
+
+    if _limit is None:
+        _limit = asyncio.Semaphore(settings.INFO_FANOUT_MAX_WORKERS)
+
+    async def run(task):
+        async with _limit:
+            try:
+                return await task()
+            except fallback_on:
+                return None
+
+    results = await asyncio.gather(*(run(task) for task in tasks.values()))
+
+    return dict(zip(tasks, results))
+
+
+async def fan_out(tasks: dict, fallback_on: tuple = ()) -> dict:
+    """Await every coroutine function in ``tasks`` concurrently, on the
+    background loop, and return their results under the same keys. Tasks
+    that raise one of ``fallback_on`` give None, any other exception is
+    re-raised.
+    """
+    if asyncio.get_running_loop() is _background_loop:
+        return await _fan_out(tasks, fallback_on)
+
+    return await asyncio.wrap_future(
+        in_background(_fan_out(tasks, fallback_on))
+    )
+
+
+_background_loop = None
+_background_lock = threading.Lock()
+
+
+def in_background(coro) -> concurrent.futures.Future:
+    """Run ``coro`` on a long-lived event loop in a daemon thread, so it
+    keeps going after the request that started it has returned, and its
+    keep-alive clients are reused by every later call.
+    """
+    global _background_loop
+
+    with _background_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="fan-out",
+                daemon=True,
+            ).start()
+
+    # A fresh context, so the coroutine does not inherit the request's and
+    # hand its sync_to_async calls to the request's thread after it is gone.
+    return contextvars.Context().run(
+        asyncio.run_coroutine_threadsafe, coro, _background_loop
+    )
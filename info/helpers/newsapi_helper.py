@@ -1,24 +1,54 @@
 # info/helpers/newsapi_helper.py
-import requests
+from urllib.parse import urlsplit
+
 from django.conf import settings
 
+from info.records import Article
+from search.utils.session import get_async_client, get_session
+from search.utils.url import URL
+
 class NewsAPIHelper:
     def __init__(self):
         self.base_url = settings.NEWSAPI_CONFIG["base_url"]
         self.api_key = settings.NEWSAPI_CONFIG["api_key"]
 
-    def get_city_news(self, city_name):
-        url = f"{self.base_url}/everything"
-        params = {
+        base_url = urlsplit(self.base_url)
+        self._url = URL(
+            protocol=base_url.scheme,
+            host=base_url.hostname,
+            port=base_url.port or 443,
+        )
+        self._session = get_session(self._url)
+
+    def _news_params(self, city_name):
+        return {
             "q": city_name,
             "apiKey": self.api_key,
             "language": "en",
             "sortBy": "relevance",
         }
-        response = requests.get(url, params=params)
-        
+
+    def get_city_news(self, city_name):
+        url = f"{self.base_url}/everything"
+        response = self._session.get(url, params=self._news_params(city_name))
+
+        return self._articles(response)
+
+    async def aget_city_news(self, city_name):
+        url = f"{self.base_url}/everything"
+        response = await get_async_client(self._url).get(
+            url, params=self._news_params(city_name)
+        )
+
+        return self._articles(response)
+
+    @staticmethod
+    def _articles(response):
         if response.status_code == 200:
-            return response.json().get("articles", [])
+            return [
+                Article.from_api(article)
+                for article in response.json().get("articles", [])
+            ]
         else:
             print(f"Error fetching news: {response.status_code}")
             return []
\ No newline at end of file
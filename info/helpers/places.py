@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from django.conf import settings
 
+from info.records import Place
 from info.utils.places import PlacesUtilBase, FourSquare
 from search.utils.url import URL
 
@@ -11,6 +12,10 @@ class CityPlacesHelperBase(ABC):
     def get_places(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_places(self, city: str, **kwargs):
+        pass
+
 
 class FourSquarePlacesHelper(CityPlacesHelperBase):
     def __init__(self, klass: PlacesUtilBase = None, url: URL = None):
@@ -21,7 +26,37 @@ class FourSquarePlacesHelper(CityPlacesHelperBase):
         self._places_util = klass(url=url)
 
     def get_places(self, city: str, **kwargs):
-        return self._places_util.get_places(city=city, **kwargs)
+        return self._project(
+            self._places_util.get_places(city=city, **kwargs)
+        )
+
+    async def aget_places(self, city: str, **kwargs):
+        return self._project(
+            await self._places_util.aget_places(city=city, **kwargs)
+        )
+
+    def get_places_by_category(self, city: str, categories: list, **kwargs):
+        buckets = self._places_util.get_places_by_category(
+            city=city, categories=categories, **kwargs
+        )
+
+        return {c: self._project(places) for c, places in buckets.items()}
+
+    async def aget_places_by_category(
+        self, city: str, categories: list, **kwargs
+    ):
+        buckets = await self._places_util.aget_places_by_category(
+            city=city, categories=categories, **kwargs
+        )
+
+        return {c: self._project(places) for c, places in buckets.items()}
+
+    @staticmethod
+    def _project(response):
+        return [Place.from_api(place) for place in response.get("results", [])]
 
     def get_place_photo(self, fsq_id: str):
         return self._places_util.get_place_photo(fsq_id=fsq_id)
+
+    async def aget_place_photo(self, fsq_id: str):
+        return await self._places_util.aget_place_photo(fsq_id=fsq_id)
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from django.conf import settings
 
+from info.records import Weather
 from info.utils.weather import WeatherBit, WeatherUtilBase
 from search.utils.url import URL
 
@@ -11,6 +12,10 @@ class CityWeatherHelperBase(ABC):
     def get_city_weather(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_city_weather(self, city: str, **kwargs):
+        pass
+
 
 class WeatherBitHelper(CityWeatherHelperBase):
     def __init__(self, klass: WeatherUtilBase = None, url: URL = None):
@@ -27,4 +32,15 @@ class WeatherBitHelper(CityWeatherHelperBase):
         self._weather_util = klass(url=url)
 
     def get_city_weather(self, city: str, **kwargs):
-        return self._weather_util.get_city_weather(city=city, **kwargs)
+        return self._project(
+            self._weather_util.get_city_weather(city=city, **kwargs)
+        )
+
+    async def aget_city_weather(self, city: str, **kwargs):
+        return self._project(
+            await self._weather_util.aget_city_weather(city=city, **kwargs)
+        )
+
+    @staticmethod
+    def _project(response):
+        return Weather.from_api(response["data"][0])
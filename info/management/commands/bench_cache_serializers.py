@@ -0,0 +1,95 @@
+import asyncio
+import pickle
+import time
+
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisSerializer
+from django.core.management.base import BaseCommand, CommandError
+
+from CityByte.cache.serializers import MsgpackSerializer, lz4
+from info.sections import SECTIONS, load_sections
+
+
+def serializers():
+    yield "pickle", RedisSerializer(pickle.HIGHEST_PROTOCOL)
+    yield "configured", MsgpackSerializer()
+    yield "msgpack", MsgpackSerializer(compression=None)
+    yield "msgpack+zlib", MsgpackSerializer(compression="zlib", threshold=0)
+    if lz4 is not None:
+        yield "msgpack+lz4", MsgpackSerializer(compression="lz4", threshold=0)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare cache serializers on the city page section payloads of the "
+        "given cities: stored size and encode/decode time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--city",
+            nargs=2,
+            action="append",
+            metavar=("CITY", "COUNTRY"),
+            required=True,
+        )
+        parser.add_argument("--repeat", type=int, default=200)
+        parser.add_argument(
+            "--fetch",
+            action="store_true",
+            help="Fetch sections that are not cached from their providers.",
+        )
+
+    def handle(self, *args, **options):
+        payloads = []
+        for city, country in options["city"]:
+            payloads += self._payloads(city, country, options["fetch"])
+
+        if not payloads:
+            raise CommandError(
+                "No cached sections for these cities, use --fetch."
+            )
+
+        repeat = options["repeat"]
+        self.stdout.write(
+            f"{len(payloads)} payloads, {repeat} rounds\n"
+            f"{'serializer':<14}{'bytes':>10}{'encode ms':>12}"
+            f"{'decode ms':>12}"
+        )
+        for name, serializer in serializers():
+            size, encode, decode = self._measure(serializer, payloads, repeat)
+            self.stdout.write(
+                f"{name:<14}{size:>10}{encode * 1000:>12.3f}"
+                f"{decode * 1000:>12.3f}"
+            )
+
+    def _payloads(self, city, country, fetch):
+        keys = [s.cache_key(city, country) for s in SECTIONS.values()]
+        entries = cache.get_many(keys)
+
+        if len(entries) < len(keys) and fetch:
+            asyncio.run(load_sections(city, country))
+            entries = cache.get_many(keys)
+
+        return list(entries.values())
+
+    @staticmethod
+    def _measure(serializer, payloads, repeat):
+        """Total stored bytes, and seconds to encode and decode every payload
+        once, averaged over ``repeat`` rounds.
+        """
+        encoded = [serializer.dumps(payload) for payload in payloads]
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for payload in payloads:
+                serializer.dumps(payload)
+        encode = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for data in encoded:
+                serializer.loads(data)
+        decode = (time.perf_counter() - start) / repeat
+
+        return sum(map(len, encoded)), encode, decode
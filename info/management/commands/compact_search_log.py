@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from info import search_log, trending
+from info.models import CitySearchRollup
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive page views older than the retention window into the city "
+        "counters and delete them, along with expired rollups, e.g. nightly "
+        "from cron."
+    )
+
+    def add_arguments(self, parser):
+        config = settings.SEARCH_LOG_RETENTION_CONFIG
+        parser.add_argument("--raw-days", type=int, default=config["raw_days"])
+        parser.add_argument(
+            "--hourly-rollup-days",
+            type=int,
+            default=config["hourly_rollup_days"],
+        )
+        parser.add_argument(
+            "--daily-rollup-days",
+            type=int,
+            default=config["daily_rollup_days"],
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=config["batch_size"]
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Give the freed pages back to the file system (SQLite).",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = options["batch_size"]
+
+        views = search_log.compact(
+            now - timedelta(days=options["raw_days"]), batch_size
+        )
+        rollups = sum(
+            trending.prune(
+                period, now - timedelta(days=options[days]), batch_size
+            )
+            for period, days in [
+                (CitySearchRollup.HOUR, "hourly_rollup_days"),
+                (CitySearchRollup.DAY, "daily_rollup_days"),
+            ]
+        )
+
+        if options["vacuum"] and connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("VACUUM")
+
+        self.stdout.write(
+            f"Compacted {views} page views and {rollups} rollups"
+        )
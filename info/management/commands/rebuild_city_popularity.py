@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from info import popularity
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the city popularity leaderboard from every recorded page "
+        "view, e.g. once after deploying it or after editing the records."
+    )
+
+    def handle(self, *args, **options):
+        start = time.monotonic()
+        cities = popularity.rebuild()
+
+        self.stdout.write(
+            f"Counted views of {cities} cities in "
+            f"{time.monotonic() - start:.1f}s"
+        )
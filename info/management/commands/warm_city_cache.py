@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from CityByte.cache.swr import is_empty
+from info import popularity
+from info.sections import SECTIONS, refresh_sections
+
+
+class Command(BaseCommand):
+    help = (
+        "Prefetch every city page section for the most viewed cities, or for "
+        "the given ones, e.g. from cron after a deploy or a Redis restart."
+    )
+
+    def add_arguments(self, parser):
+        config = settings.CACHE_WARM_CONFIG
+        parser.add_argument(
+            "--city",
+            nargs=2,
+            action="append",
+            metavar=("CITY", "COUNTRY"),
+            help="Warm these cities instead of the most viewed ones.",
+        )
+        parser.add_argument("--top", type=int, default=config["top"])
+        parser.add_argument(
+            "--concurrency", type=int, default=config["concurrency"]
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=config["rate"],
+            help="Upstream calls per second to spend on warming.",
+        )
+
+    def handle(self, *args, **options):
+        cities = options["city"] or self._top_cities(options["top"])
+
+        start = time.monotonic()
+        warmed = asyncio.run(
+            self._warm(cities, options["concurrency"], options["rate"])
+        )
+
+        self.stdout.write(
+            f"Warmed {sum(warmed)}/{len(cities)} cities in "
+            f"{time.monotonic() - start:.1f}s"
+        )
+        if cities and not any(warmed):
+            raise CommandError("No city could be warmed.")
+
+    @staticmethod
+    def _top_cities(top: int) -> list:
+        return [
+            (city.city_name, city.country_name)
+            for city in popularity.top_cities(top)
+        ]
+
+    async def _warm(self, cities, concurrency: int, rate: float) -> list:
+        limit = asyncio.Semaphore(concurrency)
+        # paced for the most upstream calls a city page can cost
+        interval = sum(s.max_calls for s in SECTIONS.values()) / rate
+
+        async def warm(city, country):
+            async with limit:
+                try:
+                    values = await refresh_sections(city, country)
+                except Exception as e:
+                    self.stderr.write(f"Could not warm {city}, {country}: {e}")
+                    return False
+
+            # a provider that failed leaves its sections empty
+            empty = [name for name, value in values.items() if is_empty(value)]
+            if empty:
+                self.stderr.write(
+                    f"Could not warm {city}, {country}: no {', '.join(empty)}"
+                )
+                return False
+
+            return True
+
+        tasks = []
+        for city, country in cities:
+            if tasks:
+                await asyncio.sleep(interval)
+            tasks.append(asyncio.create_task(warm(city, country)))
+
+        return await asyncio.gather(*tasks)
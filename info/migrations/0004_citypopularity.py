@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("info", "0003_alter_comment_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CityPopularity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("city_name", models.CharField(max_length=126)),
+                ("country_name", models.CharField(max_length=126)),
+                ("views", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["-views"], name="info_city_views_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("info", "0004_citypopularity"),
+    ]
+
+    operations = [
+        # added without a default first, so the existing views are left
+        # untimestamped rather than all dated to the migration
+        migrations.AddField(
+            model_name="citysearchrecord",
+            name="searched_on",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="citysearchrecord",
+            name="searched_on",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, null=True
+            ),
+        ),
+        migrations.CreateModel(
+            name="CitySearchRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")],
+                        max_length=4,
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                ("views", models.PositiveIntegerField(default=0)),
+                (
+                    "city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="info.citypopularity",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["period", "bucket_start"],
+                        name="info_rollup_bucket_idx",
+                    )
+                ],
+                "unique_together": {("city", "period", "bucket_start")},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("info", "0005_citysearchrollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="citypopularity",
+            name="archived_views",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("info", "0006_citypopularity_archived_views"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="citysearchrecord",
+            index=models.Index(
+                fields=["city_name", "country_name"],
+                name="info_search_city_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="citysearchrecord",
+            index=models.Index(
+                fields=["searched_on"], name="info_search_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["city", "country", "-created_on"],
+                name="info_comment_city_idx",
+            ),
+        ),
+    ]
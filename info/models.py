@@ -1,14 +1,75 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 
 class CitySearchRecord(models.Model):
     city_name = models.CharField(max_length=126)
     country_name = models.CharField(max_length=126)
+    # null for the views recorded before they were timestamped
+    searched_on = models.DateTimeField(null=True, default=timezone.now)
 
     def __str__(self):
         return f"{self.city_name}-{self.country_name}"
 
+    class Meta:
+        indexes = [
+            # popularity rebuilds group by city, reading only this index
+            models.Index(
+                fields=["city_name", "country_name"],
+                name="info_search_city_idx",
+            ),
+            # compaction walks the oldest views
+            models.Index(fields=["searched_on"], name="info_search_time_idx"),
+        ]
+
+
+class CityPopularity(models.Model):
+    """Running count of page views per city, spellings of one city counted
+    together under its canonical ``key``.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    city_name = models.CharField(max_length=126)
+    country_name = models.CharField(max_length=126)
+    views = models.PositiveBigIntegerField(default=0)
+    # views compacted out of CitySearchRecord, still counted in ``views``
+    archived_views = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.city_name}-{self.country_name}-{self.views}"
+
+    class Meta:
+        indexes = [models.Index(fields=["-views"], name="info_city_views_idx")]
+
+
+class CitySearchRollup(models.Model):
+    """Page views of one city in one hour or one day."""
+
+    HOUR = "hour"
+    DAY = "day"
+
+    city = models.ForeignKey(
+        CityPopularity, on_delete=models.CASCADE, related_name="rollups"
+    )
+    period = models.CharField(
+        max_length=4, choices=[(HOUR, "Hour"), (DAY, "Day")]
+    )
+    bucket_start = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.city}-{self.period}-{self.bucket_start}"
+
+    class Meta:
+        unique_together = (("city", "period", "bucket_start"),)
+        indexes = [
+            models.Index(
+                fields=["period", "bucket_start"],
+                name="info_rollup_bucket_idx",
+            )
+        ]
+
 
 class Comment(models.Model):
     city = models.CharField(max_length=125)
@@ -21,6 +82,13 @@ class Comment(models.Model):
         return f"{self.city}-{self.country}-{self.author.username}"
     class Meta:
         unique_together = ('author', 'comment')
+        indexes = [
+            # a city page lists its comments newest first
+            models.Index(
+                fields=["city", "country", "-created_on"],
+                name="info_comment_city_idx",
+            ),
+        ]
 
 class FavCityEntry(models.Model):
     city = models.CharField(max_length=125)
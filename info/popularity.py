@@ -0,0 +1,107 @@
+"""The city popularity leaderboard, kept as one counter row per city.
+
+Counters are bumped with every search log flush, so reading the top cities
+is an index scan over ``-views`` instead of a ``GROUP BY`` over every page
+view ever recorded. Views compacted out of the search log are kept in
+``archived_views``, so the leaderboard can still be rebuilt without them.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from CityByte.cache.keys import city_key
+from info.models import CityPopularity, CitySearchRecord
+
+
+def _count(views) -> tuple:
+    """Count ``(city, country, ...)`` views by city key, along with the
+    first spelling seen of each city.
+    """
+    counts = Counter()
+    names = {}
+    for city, country, *_ in views:
+        key = city_key(city, country)
+        counts[key] += 1
+        names.setdefault(key, (city, country))
+
+    return counts, names
+
+
+def _increment(field: str, counts: Counter, names: dict):
+    # create the missing counters first, so concurrent writers only ever
+    # increment and never race to insert the same city
+    CityPopularity.objects.bulk_create(
+        (
+            CityPopularity(key=key, city_name=city, country_name=country)
+            for key, (city, country) in names.items()
+        ),
+        ignore_conflicts=True,
+    )
+    for key, count in counts.items():
+        CityPopularity.objects.filter(key=key).update(
+            **{field: F(field) + count}
+        )
+
+
+def add_views(views: list) -> dict:
+    """Count the ``(city, country, searched_on)`` page views in ``views``.
+    Returns the ``{key: id}`` of every counter they bumped.
+    """
+    counts, names = _count(views)
+
+    with transaction.atomic():
+        _increment("views", counts, names)
+
+        return dict(
+            CityPopularity.objects.filter(key__in=counts).values_list(
+                "key", "id"
+            )
+        )
+
+
+def archive_views(views: list):
+    """Keep count of ``(city, country)`` views removed from the search log,
+    which ``views`` already includes.
+    """
+    with transaction.atomic():
+        _increment("archived_views", *_count(views))
+
+
+def top_cities(limit: int):
+    return CityPopularity.objects.order_by("-views")[:limit]
+
+
+def recorded_views():
+    """Page views still in the search log, counted per spelling of each
+    city, most viewed first.
+    """
+    return (
+        CitySearchRecord.objects.values("city_name", "country_name")
+        .annotate(views=Count("id"))
+        .order_by("-views")
+    )
+
+
+def rebuild() -> int:
+    """Recount the leaderboard from the archived views plus every page view
+    still in the search log, naming new cities by their most viewed
+    spelling. Returns the number of cities.
+    """
+    with transaction.atomic():
+        CityPopularity.objects.update(views=F("archived_views"))
+
+        counts = Counter()
+        names = {}
+        for record in recorded_views():
+            key = city_key(record["city_name"], record["country_name"])
+            counts[key] += record["views"]
+            names.setdefault(
+                key, (record["city_name"], record["country_name"])
+            )
+        _increment("views", counts, names)
+
+        # cities nobody has viewed, e.g. from records since deleted
+        CityPopularity.objects.filter(views=0).delete()
+
+        return CityPopularity.objects.count()
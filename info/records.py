@@ -0,0 +1,92 @@
+"""Compact records of what the city pages render from each provider.
+
+Helpers project provider responses onto these before anything is cached,
+so the cache holds a handful of fields per item instead of the full payload.
+"""
+from django.utils.dateparse import parse_datetime
+
+
+class Record:
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    # pickled as a bare tuple of values, without the field names
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and (
+            self.__getstate__() == other.__getstate__()
+        )
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Place(Record):
+    __slots__ = ("fsq_id", "name", "address", "category", "photo_url")
+
+    @classmethod
+    def from_api(cls, place: dict):
+        categories = place.get("categories") or [{}]
+
+        return cls(
+            fsq_id=place.get("fsq_id"),
+            name=place.get("name"),
+            address=place.get("location", {}).get("formatted_address"),
+            category=categories[0].get("name"),
+            photo_url=place.get("photo_url"),
+        )
+
+
+class Weather(Record):
+    __slots__ = (
+        "city_name",
+        "state_code",
+        "country_code",
+        "timezone",
+        "temp",
+        "app_temp",
+        "pres",
+        "wind_spd",
+        "wind_dir",
+        "clouds",
+        "precip",
+        "uv",
+        "sunrise",
+        "sunset",
+        "ts",
+    )
+
+    @classmethod
+    def from_api(cls, observation: dict):
+        return cls(**observation)
+
+
+class Article(Record):
+    __slots__ = ("title", "url", "description", "source_name", "published_at")
+
+    @classmethod
+    def from_api(cls, article: dict):
+        published_at = article.get("publishedAt")
+
+        return cls(
+            title=article.get("title"),
+            url=article.get("url"),
+            description=article.get("description"),
+            source_name=(article.get("source") or {}).get("name"),
+            published_at=published_at and parse_datetime(published_at),
+        )
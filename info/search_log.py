@@ -0,0 +1,161 @@
+"""City page views, buffered in memory and written to the database in
+batches.
+
+Recording a view only appends to this process's buffer, so serving a page
+never waits on SQLite's write lock. A daemon thread writes the buffer with
+one ``bulk_create``, and bumps the popularity and trending counters, every
+``flush_interval`` seconds, sooner once it holds ``max_buffered`` views,
+and once more when the process exits. Views still buffered when a worker
+is killed are lost, which is acceptable for what is only a popularity
+signal, and so are the oldest views beyond ``max_kept`` while the database
+cannot be written, so an outage cannot grow the buffer without bound. A
+``flush_interval`` of None leaves flushing to the caller.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from info import popularity, trending
+from info.models import CitySearchRecord
+
+logger = logging.getLogger(__name__)
+
+
+class SearchLog:
+    def __init__(self):
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher = None
+        self.dropped = 0
+
+    def record(self, city: str, country: str):
+        with self._lock:
+            self._buffer.append((city, country, timezone.now()))
+            self._trim()
+            full = (
+                len(self._buffer)
+                >= settings.SEARCH_LOG_CONFIG["max_buffered"]
+            )
+
+            if (
+                self._flusher is None
+                and settings.SEARCH_LOG_CONFIG["flush_interval"] is not None
+            ):
+                self._flusher = threading.Thread(
+                    target=self._run, name="search-log", daemon=True
+                )
+                self._flusher.start()
+                atexit.register(self.flush)
+
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write every buffered view, returning how many were written."""
+        with self._lock:
+            views, self._buffer = self._buffer, []
+
+        if not views:
+            return 0
+
+        try:
+            with transaction.atomic():
+                CitySearchRecord.objects.bulk_create(
+                    (
+                        CitySearchRecord(
+                            city_name=city,
+                            country_name=country,
+                            searched_on=searched_on,
+                        )
+                        for city, country, searched_on in views
+                    ),
+                    batch_size=settings.SEARCH_LOG_CONFIG["batch_size"],
+                )
+                trending.add_views(views, popularity.add_views(views))
+        except Exception:
+            # keep them for the next flush rather than losing the batch
+            with self._lock:
+                self._buffer[:0] = views
+                dropped = self._trim()
+            if dropped:
+                logger.warning(
+                    "Dropped the %d oldest page views, %d in all, while the "
+                    "search log cannot be written",
+                    dropped,
+                    self.dropped,
+                )
+            raise
+
+        return len(views)
+
+    def _trim(self) -> int:
+        """Drop the oldest views beyond ``max_kept``, returning how many.
+        Called with the lock held.
+        """
+        excess = len(self._buffer) - settings.SEARCH_LOG_CONFIG["max_kept"]
+        if excess <= 0:
+            return 0
+
+        del self._buffer[:excess]
+        self.dropped += excess
+        return excess
+
+    def _run(self):
+        while True:
+            self._wake.wait(settings.SEARCH_LOG_CONFIG["flush_interval"])
+            self._wake.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Could not write the search log")
+            finally:
+                close_old_connections()
+
+
+search_log = SearchLog()
+
+
+def old_views(before):
+    """The page views recorded before ``before``, untimestamped ones first,
+    each found through the ``searched_on`` index.
+    """
+    return [
+        CitySearchRecord.objects.filter(searched_on__isnull=True),
+        CitySearchRecord.objects.filter(searched_on__lt=before),
+    ]
+
+
+def compact(before, batch_size: int) -> int:
+    """Archive and delete the page views recorded before ``before``, and
+    the untimestamped ones, one transaction of ``batch_size`` rows at a
+    time so writers never wait long on the lock. Returns how many were
+    deleted.
+    """
+    deleted = 0
+    for old in old_views(before):
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    old.values_list("id", "city_name", "country_name")[
+                        :batch_size
+                    ]
+                )
+                if not batch:
+                    break
+
+                popularity.archive_views(
+                    [(city, country) for _, city, country in batch]
+                )
+                CitySearchRecord.objects.filter(
+                    id__in=[pk for pk, _, _ in batch]
+                ).delete()
+
+            deleted += len(batch)
+
+    return deleted
@@ -0,0 +1,344 @@
+import asyncio
+import time
+from datetime import datetime
+from functools import partial
+
+import httpx
+import pytz
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from CityByte.cache.keys import city_key
+from CityByte.cache.policy import timeout_for
+from CityByte.cache.swr import (
+    aget_entry_or_fetch,
+    aget_many,
+    aget_many_or_fetch,
+)
+from info.helpers.fanout import fan_out, in_background
+from info.helpers.newsapi_helper import NewsAPIHelper
+from info.helpers.places import FourSquarePlacesHelper
+from info.helpers.weather import WeatherBitHelper
+from info.records import Record
+from info.utils.places import FourSquare
+from search.helpers.photo import UnplashCityPhotoHelper
+from search.utils.breaker import CircuitOpenError
+
+
+class Section:
+    """One block of the city page: the cache key it is stored under and the
+    coroutine function that fetches it from its provider. A bundle's value
+    is a dict that is spread into the page context instead of being placed
+    under the section's own name. ``ttl`` names the kind of data in
+    ``CACHE_TTL_POLICY``; without one the cache's default timeout applies.
+    ``max_calls`` is the most upstream calls one fetch may make.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key: str,
+        fetch,
+        bundle: bool = False,
+        ttl: str = None,
+        max_calls: int = 1,
+    ):
+        self.name = name
+        self.key = key
+        self.fetch = fetch
+        self.bundle = bundle
+        self.ttl = ttl
+        self.max_calls = max_calls
+
+    def cache_key(self, city: str, country: str) -> str:
+        return self.key.format(
+            city=city, country=country, city_key=city_key(city, country)
+        )
+
+    def timeout(self):
+        if self.ttl is None:
+            return DEFAULT_TIMEOUT
+
+        return timeout_for(self.ttl)
+
+    def context(self, value) -> dict:
+        if self.bundle:
+            return value or {}
+
+        return {self.name: value}
+
+
+# context name -> Section, in registration order
+SECTIONS = {}
+
+# Failed provider calls. Fetchers let them propagate, so a background refresh
+# keeps serving the stale value, and only a cold miss shows the section empty.
+PROVIDER_ERRORS = (CircuitOpenError, httpx.HTTPError)
+
+
+class Part:
+    """A piece of the city page with its own endpoint: the section it is
+    read from, its name in the page context and the template rendering it
+    on its own, if the page shows it.
+    """
+
+    def __init__(self, section: str, name: str, template: str = None):
+        self.section = section
+        self.name = name
+        self.template = template
+
+    def data(self, context: dict):
+        """The part's value in ``context``, as plain JSON types."""
+        value = context.get(self.name)
+        if isinstance(value, list):
+            return [_as_json(item) for item in value]
+
+        return _as_json(value)
+
+
+def _as_json(value):
+    return value.as_dict() if isinstance(value, Record) else value
+
+
+# endpoint name -> Part, in page order
+PARTS = {
+    "photo": Part(
+        "photo_link", "photo_link", "search/sections/photo_link.html"
+    ),
+    "weather": Part(
+        "weather_info", "weather_info", "search/sections/weather_info.html"
+    ),
+    "news": Part("news_articles", "news_articles"),
+    "dining": Part(
+        "places", "dining_info", "search/sections/dining_info.html"
+    ),
+    "outdoor": Part(
+        "places", "outdoor_info", "search/sections/outdoor_info.html"
+    ),
+    "arts": Part("places", "arts_info", "search/sections/arts_info.html"),
+    "airports": Part(
+        "places", "airport_info", "search/sections/airport_info.html"
+    ),
+}
+
+
+def section(
+    name: str,
+    key: str,
+    bundle: bool = False,
+    ttl: str = None,
+    max_calls: int = 1,
+):
+    """Register the decorated fetcher as a section of the city page."""
+
+    def register(fetch):
+        SECTIONS[name] = Section(
+            name, key, fetch, bundle=bundle, ttl=ttl, max_calls=max_calls
+        )
+        return fetch
+
+    return register
+
+
+def _context(sections: dict, values: dict) -> dict:
+    context = {}
+    for key, section in sections.items():
+        if key in values:
+            context.update(section.context(values[key]))
+
+    return context
+
+
+def _fetchers(city: str, country: str) -> tuple:
+    """The registered sections, their fetchers and their timeouts for
+    ``city``, each keyed by the section's cache key.
+    """
+    sections = {
+        section.cache_key(city, country): section
+        for section in SECTIONS.values()
+    }
+    fetchers = {
+        key: partial(section.fetch, city=city, country=country)
+        for key, section in sections.items()
+    }
+    timeouts = {key: section.timeout() for key, section in sections.items()}
+
+    return sections, fetchers, timeouts
+
+
+def _tracking(run, ready: dict):
+    """Wrap the fan-out ``run`` so each result is put in ``ready`` as soon
+    as its own task finishes.
+    """
+
+    async def tracked(tasks: dict) -> dict:
+        async def track(key, task):
+            ready[key] = await task()
+            return ready[key]
+
+        return await run(
+            {key: partial(track, key, task) for key, task in tasks.items()}
+        )
+
+    return tracked
+
+
+async def load_sections(city: str, country: str, budget: float = None):
+    """Return the page context for every registered section, reading all of
+    them from the cache in one round trip and writing back the ones that had
+    to be fetched in another.
+
+    With a ``budget`` in seconds, the fetches run in the background and the
+    sections they have not finished by then are left out of the context and
+    their parts named in its ``pending_parts``, for the page to load from
+    their endpoints afterwards.
+    Their fetches go on and write them to the cache all the same.
+    """
+    deadline = time.monotonic() + (budget or 0)
+    sections, fetchers, timeouts = _fetchers(city, country)
+    # a provider that is down or behind an open breaker shows its sections
+    # empty
+    run = partial(fan_out, fallback_on=PROVIDER_ERRORS)
+
+    if budget is None:
+        values = await aget_many_or_fetch(fetchers, timeouts, run)
+        return _context(sections, values)
+
+    values = await aget_many(fetchers, timeouts)
+    missing = {k: f for k, f in fetchers.items() if k not in values}
+    if missing:
+        ready = {}
+        load = asyncio.wrap_future(
+            in_background(
+                aget_many_or_fetch(missing, timeouts, _tracking(run, ready))
+            )
+        )
+        try:
+            values.update(
+                await asyncio.wait_for(
+                    asyncio.shield(load), deadline - time.monotonic()
+                )
+            )
+        except asyncio.TimeoutError:
+            values.update(ready.copy())
+
+    context = _context(sections, values)
+    pending = {
+        section.name for key, section in sections.items() if key not in values
+    }
+    context["pending_parts"] = [
+        name for name, part in PARTS.items() if part.section in pending
+    ]
+
+    return context
+
+
+async def refresh_sections(city: str, country: str) -> dict:
+    """Fetch every registered section that is stale or missing from the
+    cache now, rather than in the background, and return ``{name: value}``
+    for all of them. A section whose provider failed comes back empty, and
+    its stale value, if any, stays cached.
+    """
+    sections, fetchers, timeouts = _fetchers(city, country)
+    values = await aget_many_or_fetch(
+        fetchers,
+        timeouts,
+        partial(fan_out, fallback_on=PROVIDER_ERRORS),
+        refresh=True,
+    )
+
+    return {section.name: values[key] for key, section in sections.items()}
+
+
+async def load_section(name: str, city: str, country: str) -> tuple:
+    """Return the page context for the section registered as ``name``, and
+    the time it is fresh until (None when it could not be fetched), waiting
+    for a fetch already under way rather than starting another.
+    """
+    section = SECTIONS[name]
+    try:
+        value, fresh_until = await aget_entry_or_fetch(
+            section.cache_key(city, country),
+            partial(section.fetch, city=city, country=country),
+            timeout=section.timeout(),
+        )
+    except PROVIDER_ERRORS:
+        value, fresh_until = None, None
+
+    return section.context(value), fresh_until
+
+
+@section("weather_info", "{city_key}:weather", ttl="weather")
+async def fetch_weather(city: str, country: str):
+    try:
+        weather_info = await WeatherBitHelper().aget_city_weather(
+            city=city, country=country
+        )
+    except PROVIDER_ERRORS:
+        raise
+    except Exception:
+        # WeatherBit has no weather for this city
+        return {}
+
+    timezone = pytz.timezone(weather_info.timezone)
+
+    # Handle sunrise time
+    sunrise_utc = datetime.strptime(weather_info.sunrise, "%H:%M").replace(
+        tzinfo=pytz.utc
+    )
+    weather_info.sunrise = sunrise_utc.astimezone(timezone).strftime("%I:%M")
+
+    # Handle sunset time
+    sunset_utc = datetime.strptime(weather_info.sunset, "%H:%M").replace(
+        tzinfo=pytz.utc
+    )
+    weather_info.sunset = sunset_utc.astimezone(timezone).strftime("%I:%M")
+
+    # Handle timestamp
+    weather_info.ts = (
+        datetime.fromtimestamp(weather_info.ts, tz=pytz.utc)
+        .astimezone(timezone)
+        .strftime("%m-%d-%Y, %I:%M %p")
+    )
+
+    return weather_info
+
+
+@section("news_articles", "{city_key}:news", ttl="news")
+async def fetch_news(city: str, country: str):
+    return await NewsAPIHelper().aget_city_news(city_name=city)
+
+
+# context name -> FourSquare category, all fetched by one combined search
+PLACE_CATEGORIES = {
+    "dining_info": "13065",
+    "airport_info": "19040",
+    "outdoor_info": "16000",
+    "arts_info": "10000",
+}
+
+
+# the combined search, then one re-query per category it left short
+@section(
+    "places",
+    "{city_key}:places",
+    bundle=True,
+    ttl="places",
+    max_calls=1 + len(PLACE_CATEGORIES),
+)
+async def fetch_places(city: str, country: str):
+    places = await FourSquarePlacesHelper().aget_places_by_category(
+        city=f"{city}, {country}",
+        categories=list(PLACE_CATEGORIES.values()),
+        sort="RELEVANCE",
+        limit=5,
+        fields=FourSquare.PLACE_FIELDS,
+    )
+
+    return {
+        name: places[category] for name, category in PLACE_CATEGORIES.items()
+    }
+
+
+@section("photo_link", "{city_key}:photolink", ttl="city_photo")
+async def fetch_photo_link(city: str, country: str):
+    return await UnplashCityPhotoHelper().aget_city_photo(city=city)
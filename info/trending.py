@@ -0,0 +1,140 @@
+"""Trending cities, from page views rolled up into hourly and daily buckets.
+
+Every search log flush adds its views to the hour and the day they fall
+in. A trending window sums a city's buckets over its last ``buckets``
+periods, each weighted by ``0.5 ** (age / half_life)``, so a city viewed a
+lot an hour ago outranks one viewed as much yesterday. The query only ever
+reads the window's rollup rows, never the raw page views.
+"""
+from collections import Counter
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, FloatField, Sum, When
+from django.utils import timezone
+
+from CityByte.cache.keys import city_key
+from CityByte.cache.policy import timeout_for
+from CityByte.cache.swr import get_or_fetch
+from info.models import CityPopularity, CitySearchRollup
+
+PERIODS = {
+    CitySearchRollup.HOUR: timedelta(hours=1),
+    CitySearchRollup.DAY: timedelta(days=1),
+}
+
+
+def bucket_start(moment, period: str):
+    hour = moment.replace(minute=0, second=0, microsecond=0)
+    if period == CitySearchRollup.DAY:
+        return hour.replace(hour=0)
+
+    return hour
+
+
+def add_views(views: list, cities: dict):
+    """Add the ``(city, country, searched_on)`` page views in ``views`` to
+    their buckets. ``cities`` maps their keys to CityPopularity ids.
+    """
+    counts = Counter()
+    for city, country, searched_on in views:
+        city_id = cities[city_key(city, country)]
+        for period in PERIODS:
+            counts[city_id, period, bucket_start(searched_on, period)] += 1
+
+    with transaction.atomic():
+        CitySearchRollup.objects.bulk_create(
+            (
+                CitySearchRollup(
+                    city_id=city_id, period=period, bucket_start=start
+                )
+                for city_id, period, start in counts
+            ),
+            ignore_conflicts=True,
+        )
+        for (city_id, period, start), count in counts.items():
+            CitySearchRollup.objects.filter(
+                city_id=city_id, period=period, bucket_start=start
+            ).update(views=F("views") + count)
+
+
+def scored(window: str):
+    """Every city viewed during ``window``, annotated with its ``score``,
+    highest first.
+    """
+    config = settings.TRENDING_CONFIG["windows"][window]
+    period = config["period"]
+    current = bucket_start(timezone.now(), period)
+    buckets = [
+        current - age * PERIODS[period] for age in range(config["buckets"])
+    ]
+
+    score = Sum(
+        Case(
+            *(
+                When(
+                    rollups__bucket_start=start,
+                    then=F("rollups__views")
+                    * 0.5 ** (age / config["half_life"]),
+                )
+                for age, start in enumerate(buckets)
+            ),
+            output_field=FloatField(),
+        )
+    )
+
+    return (
+        CityPopularity.objects.filter(
+            rollups__period=period, rollups__bucket_start__gte=buckets[-1]
+        )
+        .annotate(score=score)
+        .order_by("-score")
+    )
+
+
+def _top_cities(window: str, limit: int) -> list:
+    return [
+        {
+            "city_name": city.city_name,
+            "country_name": city.country_name,
+            "score": city.score,
+        }
+        for city in scored(window)[:limit]
+    ]
+
+
+def top_cities(window: str, limit: int = 10) -> list:
+    """The ``limit`` cities trending the most over ``window``, one of
+    ``TRENDING_CONFIG["windows"]``, recomputed at most every "trending"
+    timeout.
+    """
+    return get_or_fetch(
+        f"trending:{window}:{limit}",
+        partial(_top_cities, window, limit),
+        timeout=timeout_for("trending"),
+    )
+
+
+def old_rollups(period: str, before):
+    """The ``period`` rollups of buckets starting before ``before``."""
+    return CitySearchRollup.objects.filter(
+        period=period, bucket_start__lt=before
+    )
+
+
+def prune(period: str, before, batch_size: int) -> int:
+    """Delete the ``period`` rollups of buckets starting before ``before``,
+    ``batch_size`` rows at a time. Returns how many were deleted.
+    """
+    old = old_rollups(period, before)
+
+    deleted = 0
+    while True:
+        ids = list(old.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+
+        CitySearchRollup.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
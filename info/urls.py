@@ -1,6 +1,8 @@
 from django.urls import path
-from info.views import place_photo
+from info.views import city_section, place_photo, place_photos
 
 urlpatterns = [
     path("place/photo", place_photo, name="place_photo"),
+    path("place/photos", place_photos, name="place_photos"),
+    path("city/<slug:name>", city_section, name="city_section"),
 ]
@@ -1,7 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
 
-import requests
-
+from search.utils.session import get_async_client, get_session
 from search.utils.url import URL
 
 
@@ -10,37 +10,186 @@ class PlacesUtilBase(ABC):
 
     def __init__(self, url: URL):
         self._url = url
+        self._session = get_session(url)
 
     @abstractmethod
     def get_places(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_places(self, city: str, **kwargs):
+        pass
+
 
 class FourSquare(PlacesUtilBase):
+    # Search results only carry their own (leaf) category, so a category's
+    # place in the FourSquare taxonomy is recovered from its id range.
+    CATEGORY_FAMILIES = {
+        "10000": range(10000, 11000),  # Arts and Entertainment
+        "13065": range(13065, 13390),  # Restaurant
+        "16000": range(16000, 17000),  # Landmarks and Outdoors
+        "19040": range(19040, 19047),  # Airport
+    }
+    # FourSquare's maximum page size for a single search
+    MULTI_CATEGORY_LIMIT = 50
+    # what the city page renders, photos included so no per-place lookup
+    # is needed to show them
+    PLACE_FIELDS = "fsq_id,name,location,categories,photos"
+    FALLBACK_PHOTO = "https://picsum.photos/200"
+
     def get_places(self, city: str, **kwargs):
         params = self._url.with_default_params({"near": city})
         params.update(kwargs)
 
-        response = requests.request(
+        response = self._session.request(
             "GET",
             str(self._url.get_url(path="/v3/places/search")),
             headers=self._url.with_default_headers(),
             params=params,
         )
+        # an error body has no results, which would pass for a city
+        # without places
+        response.raise_for_status()
+
+        return self._with_photo_urls(response.json())
 
-        return response.json()
+    async def aget_places(self, city: str, **kwargs):
+        params = self._url.with_default_params({"near": city})
+        params.update(kwargs)
+
+        response = await get_async_client(self._url).request(
+            "GET",
+            str(self._url.get_url(path="/v3/places/search")),
+            headers=self._url.with_default_headers(),
+            params=params,
+        )
+        # an error body has no results, which would pass for a city
+        # without places
+        response.raise_for_status()
+
+        return self._with_photo_urls(response.json())
+
+    def get_places_by_category(
+        self, city: str, categories: list, limit: int = 5, **kwargs
+    ):
+        """Return ``{category: places response}`` for every category from
+        one combined search, re-querying only the categories it left short.
+        A failed search raises, without any re-query.
+        """
+        combined = self.get_places(
+            city,
+            categories=",".join(categories),
+            limit=self.MULTI_CATEGORY_LIMIT,
+            **kwargs,
+        )
+        buckets = self._split_by_category(combined, categories, limit)
+
+        for category in self._short_buckets(buckets, limit):
+            buckets[category] = self.get_places(
+                city, categories=category, limit=limit, **kwargs
+            )
+
+        return buckets
+
+    async def aget_places_by_category(
+        self, city: str, categories: list, limit: int = 5, **kwargs
+    ):
+        combined = await self.aget_places(
+            city,
+            categories=",".join(categories),
+            limit=self.MULTI_CATEGORY_LIMIT,
+            **kwargs,
+        )
+        buckets = self._split_by_category(combined, categories, limit)
+
+        short = self._short_buckets(buckets, limit)
+        refetched = await asyncio.gather(
+            *(
+                self.aget_places(
+                    city, categories=category, limit=limit, **kwargs
+                )
+                for category in short
+            )
+        )
+        buckets.update(zip(short, refetched))
+
+        return buckets
+
+    @classmethod
+    def _split_by_category(cls, response, categories: list, limit: int):
+        buckets = {category: {"results": []} for category in categories}
+
+        for place in response.get("results", []):
+            place_categories = {
+                int(category["id"]) for category in place.get("categories", [])
+            }
+
+            for category in categories:
+                family = cls.CATEGORY_FAMILIES.get(category, [int(category)])
+                results = buckets[category]["results"]
+
+                if len(results) < limit and any(
+                    place_category in family
+                    for place_category in place_categories
+                ):
+                    results.append(place)
+
+        return buckets
+
+    @staticmethod
+    def _short_buckets(buckets: dict, limit: int):
+        return [
+            category
+            for category, bucket in buckets.items()
+            if len(bucket["results"]) < limit
+        ]
 
     def get_place_photo(self, fsq_id: str, **kwargs):
-        response = requests.request(
+        response = self._session.request(
+            "GET",
+            str(self._url.get_url(path=f"/v3/places/{fsq_id}/photos")),
+            headers=self._url.with_default_headers(),
+            params=self._url.with_default_params(),
+        )
+
+        return self._photo_link(response)
+
+    async def aget_place_photo(self, fsq_id: str, **kwargs):
+        response = await get_async_client(self._url).request(
             "GET",
             str(self._url.get_url(path=f"/v3/places/{fsq_id}/photos")),
             headers=self._url.with_default_headers(),
             params=self._url.with_default_params(),
         )
 
-        try:
-            photo_data = response.json()[0]
-        except:
-            return "https://picsum.photos/200"
+        return self._photo_link(response)
+
+    @staticmethod
+    def _photo_link(response):
+        """The place's first photo, or None if it has none. An error reply
+        raises, so a quota or outage is not cached as the place's photo.
+        """
+        response.raise_for_status()
+        photos = response.json()
+        if not photos:
+            return None
+
+        return FourSquare._photo_url(photos[0])
 
+    @staticmethod
+    def _photo_url(photo_data):
         return f"{photo_data['prefix']}250x250{photo_data['suffix']}"
+
+    @classmethod
+    def _with_photo_urls(cls, response):
+        """Resolve ``photo_url`` for every place that was searched with the
+        ``photos`` field, so pages can link images without a lookup each.
+        """
+        for place in response.get("results", []):
+            if "photos" in place:
+                photos = place.pop("photos")
+                place["photo_url"] = (
+                    cls._photo_url(photos[0]) if photos else cls.FALLBACK_PHOTO
+                )
+
+        return response
@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 
-import requests
-
+from search.utils.session import get_async_client, get_session
 from search.utils.url import URL
 
 
@@ -10,17 +9,22 @@ class WeatherUtilBase(ABC):
 
     def __init__(self, url: URL):
         self._url = url
+        self._session = get_session(url)
 
     @abstractmethod
     def get_city_weather(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_city_weather(self, city: str, **kwargs):
+        pass
+
 
 class WeatherBit(WeatherUtilBase):
     def get_city_weather(self, city: str, **kwargs):
         params = self._url.with_default_params({"city": city})
         params.update(kwargs)
-        response = requests.request(
+        response = self._session.request(
             "GET",
             str(self._url.get_url(path="/v2.0/current")),
             headers=self._url.with_default_headers(),
@@ -29,3 +33,15 @@ class WeatherBit(WeatherUtilBase):
         response.raise_for_status()
         print(response.json())
         return response.json()
+
+    async def aget_city_weather(self, city: str, **kwargs):
+        params = self._url.with_default_params({"city": city})
+        params.update(kwargs)
+        response = await get_async_client(self._url).request(
+            "GET",
+            str(self._url.get_url(path="/v2.0/current")),
+            headers=self._url.with_default_headers(),
+            params=params,
+        )
+        response.raise_for_status()
+        return response.json()
@@ -16,23 +16,36 @@
 # from django.contrib import messages
 # from django.db.models import Count
 
-from datetime import datetime
-import json
-import pytz
+import time
+from functools import partial
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.views.decorators.http import require_http_methods
 
+from CityByte.cache.policy import timeout_for
+from CityByte.cache.swr import aget_many_or_fetch, get_or_fetch
+from info.helpers.fanout import fan_out
 from info.helpers.places import FourSquarePlacesHelper
-from info.helpers.weather import WeatherBitHelper
-from search.helpers.photo import UnplashCityPhotoHelper
-from info.helpers.newsapi_helper import NewsAPIHelper  # Move this here
-from .models import CitySearchRecord, Comment, FavCityEntry
-from django.core.cache import cache
+from info import popularity, trending
+from info.search_log import search_log
+from info.sections import (
+    PARTS,
+    PROVIDER_ERRORS,
+    load_section,
+    load_sections,
+)
+from info.utils.places import FourSquare
+from search.utils.breaker import CircuitOpenError
+from .models import Comment, FavCityEntry
 from .forms import CommentForm
-from django.http import JsonResponse
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Count
+from django.utils.cache import patch_cache_control
 @login_required()
 def addTofav(request):
 
@@ -66,21 +79,127 @@ def addTofav(request):
 
 @require_http_methods(["GET"])
 def place_photo(request):
-    photo_link = cache.get(f"photo-link-{request.GET.get('fsq_id')}")
+    fsq_id = request.GET.get("fsq_id")
+    try:
+        photo_link = get_or_fetch(
+            f"photo-link-{fsq_id}",
+            partial(FourSquarePlacesHelper().get_place_photo, fsq_id=fsq_id),
+            timeout=timeout_for("place_photo"),
+        )
+    except (CircuitOpenError, requests.RequestException):
+        photo_link = None
+
+    response = redirect(photo_link or FourSquare.FALLBACK_PHOTO)
+    _cache_photo_links(response, [photo_link])
+    return response
+
+
+def _cache_photo_links(response, photo_links: list):
+    # the photo behind a place rarely changes, let browsers and CDNs keep
+    # it instead of asking again on every page view, but keep a fallback
+    # only as long as the server does
+    if all(photo_links):
+        max_age = settings.PLACE_PHOTO_CONFIG["max_age"]
+    else:
+        max_age = settings.CACHE_TTL_POLICY["timeouts"]["empty"]
 
-    if not photo_link:
-        photo_link = FourSquarePlacesHelper().get_place_photo(
-            fsq_id=request.GET.get("fsq_id")
+    patch_cache_control(response, public=True, max_age=max_age)
+
+
+async def place_photos(request):
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    fsq_ids = list(
+        dict.fromkeys(
+            fsq_id
+            for fsq_id in request.GET.get("fsq_ids", "").split(",")
+            if fsq_id
         )
-        cache.set(f"photo-link-{request.GET.get('fsq_id')}", photo_link)
-    return redirect(photo_link)
+    )[: settings.PLACE_PHOTO_CONFIG["max_batch"]]
+
+    helper = FourSquarePlacesHelper()
+    fetchers = {
+        f"photo-link-{fsq_id}": partial(helper.aget_place_photo, fsq_id=fsq_id)
+        for fsq_id in fsq_ids
+    }
+
+    # one round trip for everything cached, concurrent lookups for the rest
+    photo_links = await aget_many_or_fetch(
+        fetchers,
+        timeout=timeout_for("place_photo"),
+        run=partial(fan_out, fallback_on=PROVIDER_ERRORS),
+    )
+    photo_links = [photo_links[f"photo-link-{fsq_id}"] for fsq_id in fsq_ids]
 
+    response = JsonResponse(
+        {
+            fsq_id: photo_link or FourSquare.FALLBACK_PHOTO
+            for fsq_id, photo_link in zip(fsq_ids, photo_links)
+        }
+    )
+    _cache_photo_links(response, photo_links)
+    return response
+
+
+async def info_page(request):
+    if request.method not in ("GET", "POST"):
+        return HttpResponseNotAllowed(["GET", "POST"])
 
-@require_http_methods(["GET", "POST"])
-def info_page(request):
     city = request.GET.get("city")
     country = request.GET.get("country")
 
+    config = settings.INFO_PAGE_CONFIG
+    if config["skeleton"]:
+        # every section is fetched by the page itself, from its endpoint
+        sections = {"pending_parts": list(PARTS)}
+    else:
+        sections = await load_sections(city, country, budget=config["budget"])
+
+    return await sync_to_async(_render_info_page)(
+        request, city, country, sections
+    )
+
+
+async def city_section(request, name):
+    """One part of the city page as JSON: its data, and its HTML for a page
+    that left it out. Shared caches may keep it only for as long as the
+    entry served stays fresh here.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    part = PARTS.get(name)
+    if part is None:
+        raise Http404(f"Unknown section {name}")
+
+    city = request.GET.get("city")
+    country = request.GET.get("country")
+
+    context, fresh_until = await load_section(part.section, city, country)
+    data = part.data(context)
+    html = None
+    if part.template is not None:
+        html = render_to_string(
+            part.template, {**context, "city": city, "country": country}
+        )
+
+    max_age = 0
+    if fresh_until is not None:
+        max_age = max(0, int(fresh_until - time.time()))
+    if not data:
+        max_age = min(max_age, settings.CACHE_TTL_POLICY["timeouts"]["empty"])
+
+    response = JsonResponse({"data": data, "html": html})
+    if max_age:
+        patch_cache_control(response, public=True, max_age=max_age)
+    else:
+        # stale, or not fetched at all: ask again every time
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _render_info_page(request, city, country, sections):
     if request.method == "POST":
         commentForm = CommentForm(request.POST)
 
@@ -99,92 +218,7 @@ def info_page(request):
     #     CitySearchRecord.objects.filter(city_name=city, country_name=country).count()
     #     == 0
     # ):
-    CitySearchRecord.objects.create(city_name=city, country_name=country)
-
-    # try cache first
-    weather_info = cache.get(f"{city}-weather")
-    if not weather_info:
-        try:
-            weather_info = WeatherBitHelper().get_city_weather(
-                    city=city, country=country
-                )["data"][0]
-
-            # Handle sunrise time 
-            sunrise_utc = datetime.strptime(weather_info["sunrise"], "%H:%M").replace(tzinfo=pytz.utc)
-            weather_info["sunrise"] = (
-                sunrise_utc.astimezone(pytz.timezone(weather_info["timezone"]))
-                .strftime("%I:%M")  # Added AM/PM format
-            )
-
-            # Handle sunset time
-            sunset_utc = datetime.strptime(weather_info["sunset"], "%H:%M").replace(tzinfo=pytz.utc)
-            weather_info["sunset"] = (
-                sunset_utc.astimezone(pytz.timezone(weather_info["timezone"]))
-                .strftime("%I:%M")  # Added AM/PM format
-            )
-
-            # Handle timestamp
-            weather_info["ts"] = datetime.fromtimestamp(
-                weather_info["ts"],
-                tz=pytz.utc  # Assuming the timestamp is in UTC
-            ).astimezone(pytz.timezone(weather_info["timezone"])).strftime("%m-%d-%Y, %I:%M %p")  # Added AM/PM format
-            # Cache the weather information
-            cache.set(f"{city}-weather", weather_info)
-        except Exception:
-            weather_info = {}
-    # News Info
-    news_articles = cache.get(f"{city}-news")
-    if not news_articles:
-        news_articles = NewsAPIHelper().get_city_news(city_name=city)
-        cache.set(f"{city}-news", news_articles)
-
-    dining_info = cache.get(f"{city}-dinning")
-    if not dining_info:
-        dining_info = FourSquarePlacesHelper().get_places(
-            city=f"{city}, {country}",
-            categories="13065",
-            sort="RELEVANCE",
-            limit=5,
-        )
-        cache.set(f"{city}-dinning", dining_info)
-
-    airport_info = cache.get(f"{city}-airport")
-    if not airport_info:
-        airport_info = FourSquarePlacesHelper().get_places(
-            city=f"{city}, {country}",
-            categories="19040",
-            sort="RELEVANCE",
-            limit=5,
-        )
-
-        cache.set(f"{city}-airport", airport_info)
-
-    outdoor_info = cache.get(f"{city}-outdoor")
-    if not outdoor_info:
-        outdoor_info = FourSquarePlacesHelper().get_places(
-            city=f"{city}, {country}",
-            categories="16000",
-            sort="RELEVANCE",
-            limit=5,
-        )
-
-        cache.set(f"{city}-outdoor", outdoor_info)
-
-    arts_info = cache.get(f"{city}-arts")
-    if not arts_info:
-        arts_info = FourSquarePlacesHelper().get_places(
-            city=f"{city}, {country}",
-            categories="10000",
-            sort="RELEVANCE",
-            limit=5,
-        )
-
-        cache.set(f"{city}-arts", arts_info)
-
-    photo_link = cache.get(f"{city}-photolink")
-    if not photo_link:
-        photo_link = UnplashCityPhotoHelper().get_city_photo(city=city)
-        cache.set(f"{city}-photolink", photo_link)
+    search_log.record(city, country)
 
     comments = Comment.objects.filter(city=city, country=country).order_by(
         "-created_on"
@@ -201,18 +235,12 @@ def info_page(request):
         request,
         "search/city_info.html",
         context={
-            "weather_info": weather_info,
-            "dining_info": dining_info,
-            "airport_info": airport_info,
-            "outdoor_info": outdoor_info,
-            "arts_info": arts_info,
-            "photo_link": photo_link,
+            **sections,
             "comments": comments,
             "commentForm": commentForm,
             "city": city,
             "country": country,
             "isInFav": isInFav,
-            "news_articles": news_articles,
         },
     )
 
@@ -221,14 +249,15 @@ def info_page(request):
 def profile_page(request):
 
     favCities = FavCityEntry.objects.filter(user=request.user)
-    popularCities = (
-        CitySearchRecord.objects.values("city_name")
-        .annotate(city_count=Count("city_name"))
-        .order_by("-city_count")[:10]
-    )
+    popularCities = popularity.top_cities(10)
 
     return render(
         request,
         "profile/profile.html",
-        {"favCities": favCities, "popularCities": popularCities},
+        {
+            "favCities": favCities,
+            "popularCities": popularCities,
+            "trendingToday": trending.top_cities("day"),
+            "trendingThisWeek": trending.top_cities("week"),
+        },
     )
@@ -12,6 +12,10 @@ class SearchAutoCompleteHelperBase(ABC):
     def get_suggestions(self, city: str):
         pass
 
+    @abstractmethod
+    async def aget_suggestions(self, city: str):
+        pass
+
 
 class GenericDBSearchAutoCompleteHelper(SearchAutoCompleteHelperBase):
     def __init__(self, klass: SearchUtilBase = None, url: URL = None):
@@ -23,3 +27,8 @@ class GenericDBSearchAutoCompleteHelper(SearchAutoCompleteHelperBase):
 
     def get_suggestions(self, city: str, **kwargs):
         return self._search_util.get_city_suggestions(city=city, **kwargs)
+
+    async def aget_suggestions(self, city: str, **kwargs):
+        return await self._search_util.aget_city_suggestions(
+            city=city, **kwargs
+        )
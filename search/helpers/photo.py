@@ -12,6 +12,10 @@ class CityPhotoHelperBase(ABC):
     def get_city_photo(self, city: str):
         pass
 
+    @abstractmethod
+    async def aget_city_photo(self, city: str):
+        pass
+
 
 class UnplashCityPhotoHelper(CityPhotoHelperBase):
     def __init__(self, klass: PhotoUtilBase = None, url: URL = None):
@@ -24,6 +28,15 @@ class UnplashCityPhotoHelper(CityPhotoHelperBase):
     def get_city_photo(self, city: str):
         photo_list = self._photo_util.get_photos(query=city)
 
+        return self._pick_photo(photo_list)
+
+    async def aget_city_photo(self, city: str):
+        photo_list = await self._photo_util.aget_photos(query=city)
+
+        return self._pick_photo(photo_list)
+
+    @staticmethod
+    def _pick_photo(photo_list):
         if len(photo_list) == 0:
             return None
 
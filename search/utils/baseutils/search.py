@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from search.utils.session import get_session
 from search.utils.url import URL
 
 
@@ -8,7 +9,12 @@ class SearchUtilBase(ABC):
 
     def __init__(self, url: URL):
         self._url = url
+        self._session = get_session(url)
 
     @abstractmethod
     def get_city_suggestions(self, city: str, **kwargs):
         pass
+
+    @abstractmethod
+    async def aget_city_suggestions(self, city: str, **kwargs):
+        pass
@@ -0,0 +1,163 @@
+"""Per-provider circuit breakers, shared by every worker through the cache.
+
+Each worker keeps a rolling window of its own calls to a provider. Once
+enough of them fail (errors, 5xx, 429 or calls slower than ``slow_call``), it
+opens the breaker for every worker by caching ``(open_until, open_timeout)``.
+While open, calls fail fast with ``CircuitOpenError`` and callers fall back
+to cached or empty data. When ``open_until`` passes, the breaker is
+half-open: one worker at a time, holding the single-flight lock, lets a
+probe call through. A good probe closes the breaker, a bad one re-opens it
+for twice as long, up to ``max_open_timeout``.
+"""
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import cache
+
+from CityByte.cache.singleflight import aacquire, acquire, arelease, release
+
+
+class CircuitOpenError(Exception):
+    """The provider's breaker is open, the call was not made."""
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def _key(self) -> str:
+        return f"breaker:{self.name}"
+
+    def before(self):
+        """Raise ``CircuitOpenError`` unless the call may go out. Returns the
+        probe to pass to ``after`` when the call is a half-open probe.
+        """
+        state = cache.get(self._key)
+        if not self._check_open(state):
+            return None
+
+        token = acquire(self._key)
+        if token is None:
+            raise CircuitOpenError(self.name)
+
+        return token, state[1]
+
+    def after(self, probe, failed: bool):
+        if probe is None:
+            if self._record(failed):
+                self._open(settings.CIRCUIT_BREAKER_CONFIG["open_timeout"])
+            return
+
+        token, open_timeout = probe
+        try:
+            if failed:
+                self._open(self._backoff(open_timeout))
+            else:
+                cache.delete(self._key)
+        finally:
+            release(self._key, token)
+
+    async def abefore(self):
+        state = await cache.aget(self._key)
+        if not self._check_open(state):
+            return None
+
+        token = await aacquire(self._key)
+        if token is None:
+            raise CircuitOpenError(self.name)
+
+        return token, state[1]
+
+    async def aafter(self, probe, failed: bool):
+        if probe is None:
+            if self._record(failed):
+                await self._aopen(
+                    settings.CIRCUIT_BREAKER_CONFIG["open_timeout"]
+                )
+            return
+
+        token, open_timeout = probe
+        try:
+            if failed:
+                await self._aopen(self._backoff(open_timeout))
+            else:
+                await cache.adelete(self._key)
+        finally:
+            await arelease(self._key, token)
+
+    def is_failure(self, status_code: int, elapsed: float) -> bool:
+        return (
+            status_code >= 500
+            or status_code == 429
+            or elapsed > settings.CIRCUIT_BREAKER_CONFIG["slow_call"]
+        )
+
+    def _check_open(self, state) -> bool:
+        """Raise while the breaker is open, True once it is half-open."""
+        if state is None:
+            return False
+
+        open_until, _ = state
+        if time.time() < open_until:
+            raise CircuitOpenError(self.name)
+
+        return True
+
+    def _record(self, failed: bool) -> bool:
+        """Add a call to this worker's window, True if it should trip."""
+        config = settings.CIRCUIT_BREAKER_CONFIG
+        now = time.monotonic()
+
+        with self._lock:
+            self._calls.append((now, failed))
+            while self._calls[0][0] < now - config["window"]:
+                self._calls.popleft()
+
+            failures = sum(call_failed for _, call_failed in self._calls)
+            if (
+                len(self._calls) < config["min_calls"]
+                or failures / len(self._calls) < config["failure_rate"]
+            ):
+                return False
+
+            self._calls.clear()
+            return True
+
+    @staticmethod
+    def _backoff(open_timeout: int) -> int:
+        config = settings.CIRCUIT_BREAKER_CONFIG
+
+        return min(open_timeout * 2, config["max_open_timeout"])
+
+    def _state(self, open_timeout: int):
+        # outlive open_until so the next call finds the breaker half-open
+        config = settings.CIRCUIT_BREAKER_CONFIG
+
+        return (
+            (time.time() + open_timeout, open_timeout),
+            open_timeout + config["max_open_timeout"],
+        )
+
+    def _open(self, open_timeout: int):
+        cache.set(self._key, *self._state(open_timeout))
+
+    async def _aopen(self, open_timeout: int):
+        await cache.aset(self._key, *self._state(open_timeout))
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name))
+
+    return breaker
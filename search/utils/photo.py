@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 
-import requests
-
+from search.utils.session import get_async_client, get_session
 from search.utils.url import URL
 
 
@@ -10,11 +9,16 @@ class PhotoUtilBase(ABC):
 
     def __init__(self, url: URL):
         self._url = url
+        self._session = get_session(url)
 
     @abstractmethod
     def get_photos(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_photos(self, city: str, **kwargs):
+        pass
+
 
 class Unsplash(PhotoUtilBase):
     class Orientation:
@@ -25,7 +29,22 @@ class Unsplash(PhotoUtilBase):
         page = kwargs.get("page", 1)
         orientation = kwargs.get("orientation", Unsplash.Orientation.LANDSCAPE)
 
-        response = requests.request(
+        response = self._session.request(
+            "GET",
+            str(self._url.get_url(path="/search/photos")),
+            headers=self._url.with_default_headers(),
+            params=self._url.with_default_params(
+                {"page": page, "orientation": orientation, "query": query}
+            ),
+        )
+
+        return response.json().get("results", [])
+
+    async def aget_photos(self, query: str, **kwargs):
+        page = kwargs.get("page", 1)
+        orientation = kwargs.get("orientation", Unsplash.Orientation.LANDSCAPE)
+
+        response = await get_async_client(self._url).request(
             "GET",
             str(self._url.get_url(path="/search/photos")),
             headers=self._url.with_default_headers(),
@@ -1,8 +1,19 @@
+import time
 from abc import ABC, abstractmethod
 
-import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
-
+from django.core.cache import cache
+
+from CityByte.cache.singleflight import (
+    aacquire,
+    acquire,
+    arelease,
+    await_value,
+    release,
+    wait_for_value,
+)
+from search.utils.session import get_async_client, get_session
 from search.utils.url import URL
 
 
@@ -11,22 +22,42 @@ class SearchUtilBase(ABC):
 
     def __init__(self, url: URL):
         self._url = url
+        self._session = get_session(url)
 
     @abstractmethod
     def get_city_suggestions(self, city: str, **kwargs):
         pass
 
+    @abstractmethod
+    async def aget_city_suggestions(self, city: str, **kwargs):
+        pass
+
 
 class GeoDB(SearchUtilBase):
     def get_city_suggestions(self, city: str, **kwargs):
         offset = kwargs.get("offset", 0)
         limit = kwargs.get("limit", 10)
 
-        response = requests.request(
+        response = self._session.request(
             "GET",
             str(self._url.get_url(path="/v1/geo/cities")),
             headers=self._url.with_default_headers(),
-            params=self._url.with_default_headers(
+            params=self._url.with_default_params(
+                {"namePrefix": city, "offset": offset, "limit": limit}
+            ),
+        )
+
+        return response.json()
+
+    async def aget_city_suggestions(self, city: str, **kwargs):
+        offset = kwargs.get("offset", 0)
+        limit = kwargs.get("limit", 10)
+
+        response = await get_async_client(self._url).request(
+            "GET",
+            str(self._url.get_url(path="/v1/geo/cities")),
+            headers=self._url.with_default_headers(),
+            params=self._url.with_default_params(
                 {"namePrefix": city, "offset": offset, "limit": limit}
             ),
         )
@@ -35,51 +66,145 @@ class GeoDB(SearchUtilBase):
 
 
 class AmadeusCitySearch(SearchUtilBase):
-    def __init__(self, url: URL):
-        self._access_token = None
-        super().__init__(url)
+    # One OAuth token shared by every worker through the cache, stored as
+    # (token, expires_at) and refreshed a little before Amadeus expires it.
+    TOKEN_CACHE_KEY = "amadeus-access-token"
 
     def get_city_suggestions(self, city: str, **kwargs):
         params = self._url.with_default_params({"keyword": city})
         params.update(kwargs)
 
-        success = False
+        for _ in range(settings.AMADEUS_TOKEN_CONFIG["max_attempts"]):
+            access_token = self._get_access_token()
+            response = self._session.request(
+                "GET",
+                str(
+                    self._url.get_url(
+                        path="/v1/reference-data/locations/cities"
+                    )
+                ),
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+            )
+
+            if not self._is_unauthorized(response):
+                break
+
+            self._discard_access_token(access_token)
+
+        return response.json()
 
-        while not success:
-            response = requests.request(
+    async def aget_city_suggestions(self, city: str, **kwargs):
+        params = self._url.with_default_params({"keyword": city})
+        params.update(kwargs)
+
+        for _ in range(settings.AMADEUS_TOKEN_CONFIG["max_attempts"]):
+            access_token = await self._aget_access_token()
+            response = await get_async_client(self._url).request(
                 "GET",
                 str(
                     self._url.get_url(
                         path="/v1/reference-data/locations/cities"
                     )
                 ),
-                headers={"Authorization": f"Bearer {self._access_token}"},
+                headers={"Authorization": f"Bearer {access_token}"},
                 params=params,
             )
 
-            if (
-                response.json().get("errors")
-                and response.json()["errors"][0]["status"] == 401
-            ):
-                response = requests.request(
-                    "POST",
-                    str(self._url.get_url(path="/v1/security/oauth2/token")),
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded"
-                    },
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": settings.AMADEUS_CONFIG["headers"][
-                            "API_KEY"
-                        ],
-                        "client_secret": settings.AMADEUS_CONFIG["headers"][
-                            "API_SECRET_KEY"
-                        ],
-                    },
-                )
-
-                self._access_token = response.json()["access_token"]
-            else:
-                success = True
+            if not self._is_unauthorized(response):
+                break
+
+            await self._adiscard_access_token(access_token)
 
         return response.json()
+
+    @staticmethod
+    def _is_unauthorized(response):
+        errors = response.json().get("errors")
+
+        return bool(errors) and errors[0]["status"] == 401
+
+    def _get_access_token(self):
+        entry = cache.get(self.TOKEN_CACHE_KEY)
+        if entry is not None and not self._needs_refresh(entry):
+            return entry[0]
+
+        # Only one worker requests a new token; while a still-valid token
+        # is being refreshed ahead of expiry the others keep using it.
+        token = acquire(self.TOKEN_CACHE_KEY)
+        if token is None:
+            entry = entry or wait_for_value(self.TOKEN_CACHE_KEY)
+            if entry is not None:
+                return entry[0]
+
+        try:
+            response = self._session.request("POST", **self._token_request())
+            return self._store_access_token(response.json())
+        finally:
+            if token is not None:
+                release(self.TOKEN_CACHE_KEY, token)
+
+    async def _aget_access_token(self):
+        entry = await cache.aget(self.TOKEN_CACHE_KEY)
+        if entry is not None and not self._needs_refresh(entry):
+            return entry[0]
+
+        token = await aacquire(self.TOKEN_CACHE_KEY)
+        if token is None:
+            entry = entry or await await_value(self.TOKEN_CACHE_KEY)
+            if entry is not None:
+                return entry[0]
+
+        try:
+            response = await get_async_client(self._url).request(
+                "POST", **self._token_request()
+            )
+            return await sync_to_async(self._store_access_token)(
+                response.json()
+            )
+        finally:
+            if token is not None:
+                await arelease(self.TOKEN_CACHE_KEY, token)
+
+    @staticmethod
+    def _needs_refresh(entry):
+        _, expires_at = entry
+        margin = settings.AMADEUS_TOKEN_CONFIG["refresh_margin"]
+
+        return time.time() >= expires_at - margin
+
+    def _store_access_token(self, token_data):
+        access_token = token_data["access_token"]
+        expires_in = int(token_data.get("expires_in", 0))
+
+        if expires_in > 0:
+            cache.set(
+                self.TOKEN_CACHE_KEY,
+                (access_token, time.time() + expires_in),
+                expires_in,
+            )
+
+        return access_token
+
+    def _discard_access_token(self, access_token):
+        entry = cache.get(self.TOKEN_CACHE_KEY)
+        if entry is not None and entry[0] == access_token:
+            cache.delete(self.TOKEN_CACHE_KEY)
+
+    async def _adiscard_access_token(self, access_token):
+        entry = await cache.aget(self.TOKEN_CACHE_KEY)
+        if entry is not None and entry[0] == access_token:
+            await cache.adelete(self.TOKEN_CACHE_KEY)
+
+    def _token_request(self):
+        return {
+            "url": str(self._url.get_url(path="/v1/security/oauth2/token")),
+            "headers": {"Content-Type": "application/x-www-form-urlencoded"},
+            "data": {
+                "grant_type": "client_credentials",
+                "client_id": settings.AMADEUS_CONFIG["headers"]["API_KEY"],
+                "client_secret": settings.AMADEUS_CONFIG["headers"][
+                    "API_SECRET_KEY"
+                ],
+            },
+        }
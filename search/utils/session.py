@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+import weakref
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from search.utils.breaker import CircuitBreaker, get_breaker
+from search.utils.url import URL
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# httpx clients are bound to the event loop they were first used on, so the
+# async pools are kept per running loop and closed together with it.
+_async_clients = weakref.WeakKeyDictionary()
+_async_closers = weakref.WeakKeyDictionary()
+
+
+class BreakerAdapter(HTTPAdapter):
+    """Sends every request through the host's circuit breaker, with the
+    given ``(connect, read)`` timeout unless the caller passed its own.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, timeout=None, **kwargs):
+        self.breaker = breaker
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        probe = self.breaker.before()
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.breaker.after(probe, failed=True)
+            raise
+
+        self.breaker.after(
+            probe,
+            failed=self.breaker.is_failure(
+                response.status_code, time.monotonic() - start
+            ),
+        )
+        return response
+
+
+class BreakerTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, breaker: CircuitBreaker, **kwargs):
+        self.breaker = breaker
+        super().__init__(**kwargs)
+
+    async def handle_async_request(self, request):
+        probe = await self.breaker.abefore()
+        start = time.monotonic()
+        try:
+            response = await super().handle_async_request(request)
+        except Exception:
+            await self.breaker.aafter(probe, failed=True)
+            raise
+
+        await self.breaker.aafter(
+            probe,
+            failed=self.breaker.is_failure(
+                response.status_code, time.monotonic() - start
+            ),
+        )
+        return response
+
+
+def _build_session(url: URL) -> requests.Session:
+    config = settings.HTTP_POOL_CONFIG
+
+    # Only connection failures are retried: the request never reached the
+    # provider, so retrying cannot double-spend quota.
+    retries = Retry(
+        total=config["connect_retries"],
+        connect=config["connect_retries"],
+        read=0,
+        status=0,
+        backoff_factor=config["backoff_factor"],
+    )
+    adapter = BreakerAdapter(
+        get_breaker(url.host),
+        timeout=(config["connect_timeout"], config["read_timeout"]),
+        pool_connections=config["pool_connections"],
+        pool_maxsize=config["pool_maxsize"],
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def get_session(url: URL) -> requests.Session:
+    """Return the process-wide keep-alive session for the host in ``url``."""
+    key = url.get_url(path="")
+
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.setdefault(key, _build_session(url))
+
+    return session
+
+
+def _build_async_client(url: URL) -> httpx.AsyncClient:
+    config = settings.HTTP_POOL_CONFIG
+
+    # httpx transports only retry failed connection attempts, which matches
+    # the connect-only retry policy of the sync sessions.
+    transport = BreakerTransport(
+        get_breaker(url.host),
+        retries=config["connect_retries"],
+        limits=httpx.Limits(
+            max_connections=config["pool_maxsize"],
+            max_keepalive_connections=config["pool_maxsize"],
+        ),
+    )
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            config["read_timeout"], connect=config["connect_timeout"]
+        ),
+    )
+
+
+async def _close_with_loop(clients: dict):
+    """Parked on its loop until ``asyncio.run`` shuts down the loop's async
+    generators, right before closing it, then closes the loop's clients.
+    Short-lived loops, one per WSGI request or sync refresh, so do not leak
+    their connections.
+    """
+    try:
+        yield
+    finally:
+        await asyncio.gather(
+            *(client.aclose() for client in clients.values()),
+            return_exceptions=True,
+        )
+
+
+def get_async_client(url: URL) -> httpx.AsyncClient:
+    """Return the keep-alive async client for the host in ``url`` on the
+    running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.get(loop)
+    if clients is None:
+        clients = _async_clients[loop] = {}
+        closer = _async_closers[loop] = _close_with_loop(clients)
+        asyncio.ensure_future(closer.__anext__())
+
+    key = url.get_url(path="")
+
+    if key not in clients:
+        clients[key] = _build_async_client(url)
+
+    return clients[key]
@@ -9,13 +9,20 @@
 # from search.utils.url import URL
 # from django.contrib.auth.decorators import login_required
 # from django.contrib.auth import get_user_model
+from functools import partial
+
 from django.conf import settings
-from django.http import JsonResponse
+from django.http import HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
  
+from CityByte.cache.keys import city_key
+from CityByte.cache.policy import timeout_for
+from CityByte.cache.swr import get_or_fetch
+from info import trending
 from search.helpers.autocomplete import GenericDBSearchAutoCompleteHelper
 from search.helpers.photo import UnplashCityPhotoHelper
+from search.utils.breaker import CircuitOpenError
 from search.utils.search import AmadeusCitySearch
 from search.utils.url import URL
 from django.contrib.auth.decorators import login_required
@@ -30,23 +37,43 @@ from langchain.chains import LLMChain
 @require_http_methods(["GET"])
 def main_page(request):
     user_count = get_user_model().objects.all().count()
-    return render(request, "search/search.html", context={"request": request, "userCount": user_count})
+    return render(
+        request,
+        "search/search.html",
+        context={
+            "request": request,
+            "userCount": user_count,
+            "trendingCities": trending.top_cities("day", 5),
+        },
+    )
  
  
-@require_http_methods(["GET"])
-def city_suggestions(request):
-    suggestions_data = GenericDBSearchAutoCompleteHelper(
-        klass=AmadeusCitySearch, url=URL(**settings.AMADEUS_CONFIG)
-    ).get_suggestions(city=request.GET.get("q"), max=10)
+async def city_suggestions(request):
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    try:
+        suggestions_data = await GenericDBSearchAutoCompleteHelper(
+            klass=AmadeusCitySearch, url=URL(**settings.AMADEUS_CONFIG)
+        ).aget_suggestions(city=request.GET.get("q"), max=10)
+    except CircuitOpenError:
+        suggestions_data = {}
  
     return JsonResponse({"results": suggestions_data.get("data", [])})
  
  
 @require_http_methods(["GET"])
 def city_photo(request):
-    photo_link = UnplashCityPhotoHelper().get_city_photo(
-        city=request.GET.get("q")
-    )
+    city = request.GET.get("q")
+    # shares the city page's photo key, so either page warms the other
+    try:
+        photo_link = get_or_fetch(
+            f"{city_key(city, request.GET.get('country'))}:photolink",
+            partial(UnplashCityPhotoHelper().get_city_photo, city=city),
+            timeout=timeout_for("city_photo"),
+        )
+    except CircuitOpenError:
+        photo_link = None
     return JsonResponse(
         {
             "path": photo_link,